@@ -8,12 +8,24 @@ import json
 from typing import Optional
 from cerebras.cloud.sdk import Cerebras
 
+try:
+    import orjson
+except ImportError:  # Optional: faster parsing of JSON-mode responses
+    orjson = None
+
 
 # ============ CONFIGURATION ============
 
 DEFAULT_MODEL = "zai-glm-4.7"
 
 
+def _loads(text: str):
+    """Parse a JSON response; orjson errors subclass json.JSONDecodeError."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
 def _get_api_key() -> str:
     """Get API key from environment (lazy load to support dotenv)."""
     key = os.environ.get("CEREBRAS_API_KEY")
@@ -167,7 +179,7 @@ Use null for hypothesis if not apparent. Use empty arrays [] for next_steps, dec
 
     try:
         response = complete(prompt, system=system, json_mode=True, max_tokens=800)
-        result = json.loads(response)
+        result = _loads(response)
 
         # Ensure all expected keys exist with defaults
         return {
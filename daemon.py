@@ -7,10 +7,12 @@ storing them to Backboard.io for infinite memory.
 import asyncio
 import json
 import os
+import re
 import signal
 import sys
 import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -24,6 +26,11 @@ import cerebras_client
 import backboard_client
 from backboard_client import BackboardError
 
+try:
+    import orjson
+except ImportError:  # Optional: faster state file reads/writes
+    orjson = None
+
 
 # ============ CONFIGURATION ============
 
@@ -47,10 +54,16 @@ MAX_CHUNK_CHARS = 30000
 
 # ============ LOGGING ============
 
+@lru_cache(maxsize=1)
+def _log_timestamp(second: int) -> str:
+    """Format a log timestamp; lines logged within the same second reuse it."""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+
+
 def log(message: str):
     """Write to daemon log file."""
     DAEMON_STATE_DIR.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = _log_timestamp(int(time.time()))
     line = f"[{timestamp}] {message}\n"
     with open(LOG_FILE, "a") as f:
         f.write(line)
@@ -65,6 +78,8 @@ def load_state() -> dict:
     """Load daemon state (tracks processed lines per session)."""
     if STATE_FILE.exists():
         try:
+            if orjson is not None:
+                return orjson.loads(STATE_FILE.read_bytes())
             with open(STATE_FILE) as f:
                 return json.load(f)
         except (json.JSONDecodeError, IOError):
@@ -76,9 +91,22 @@ def load_state() -> dict:
     }
 
 
+# Match json.dump(indent=2, default=str): datetimes go through str() and
+# non-str keys are coerced, so the file format doesn't depend on orjson
+_ORJSON_STATE_OPTIONS = (
+    orjson.OPT_INDENT_2
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+) if orjson is not None else 0
+
+
 def save_state(state: dict):
     """Save daemon state."""
     DAEMON_STATE_DIR.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        STATE_FILE.write_bytes(orjson.dumps(state, option=_ORJSON_STATE_OPTIONS, default=str))
+        return
     with open(STATE_FILE, "w") as f:
         json.dump(state, f, indent=2, default=str)
 
@@ -110,11 +138,20 @@ CONVERSATION:
 {conversation}
 """
 
+# Static text around the conversation, unescaped once so each call only concatenates
+_EXTRACTION_PROMPT_HEAD, _, _EXTRACTION_PROMPT_TAIL = EXTRACTION_PROMPT.partition("{conversation}")
+_EXTRACTION_PROMPT_HEAD = _EXTRACTION_PROMPT_HEAD.format()
+_EXTRACTION_PROMPT_TAIL = _EXTRACTION_PROMPT_TAIL.format()
+_EXTRACTION_SYSTEM = "You are an expert at identifying key technical insights from conversations. Output valid JSON only."
+
+
+# Markdown code fence around the model's JSON, and any bracketed array
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*([\s\S]*?)\s*```')
+_JSON_ARRAY_RE = re.compile(r'\[[\s\S]*\]')
+
 
 def _extract_json_from_response(response: str) -> list:
     """Extract JSON array from response, handling markdown wrapping."""
-    import re
-
     # Try direct parse first
     try:
         result = json.loads(response)
@@ -124,7 +161,7 @@ def _extract_json_from_response(response: str) -> list:
         pass
 
     # Try to extract from markdown code block
-    code_block_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', response)
+    code_block_match = _JSON_FENCE_RE.search(response)
     if code_block_match:
         try:
             result = json.loads(code_block_match.group(1))
@@ -134,7 +171,7 @@ def _extract_json_from_response(response: str) -> list:
             pass
 
     # Try to find array in response
-    array_match = re.search(r'\[[\s\S]*\]', response)
+    array_match = _JSON_ARRAY_RE.search(response)
     if array_match:
         try:
             result = json.loads(array_match.group())
@@ -152,10 +189,10 @@ async def extract_insights(conversation_text: str) -> list[dict]:
         return []
 
     try:
-        prompt = EXTRACTION_PROMPT.format(conversation=conversation_text[:MAX_CHUNK_CHARS])
+        prompt = f"{_EXTRACTION_PROMPT_HEAD}{conversation_text[:MAX_CHUNK_CHARS]}{_EXTRACTION_PROMPT_TAIL}"
         response = cerebras_client.complete(
             prompt=prompt,
-            system="You are an expert at identifying key technical insights from conversations. Output valid JSON only.",
+            system=_EXTRACTION_SYSTEM,
             json_mode=True,
             max_tokens=2000
         )
@@ -193,6 +230,7 @@ async def store_insights(insights: list[dict], session_id: str, cwd: str):
         log("No BACKBOARD_PERSONAL_THREAD_ID, skipping cloud storage")
         return
 
+    to_store = []
     for insight in insights:
         category = insight.get("category", "learning")
         text = insight.get("insight", "")
@@ -200,20 +238,29 @@ async def store_insights(insights: list[dict], session_id: str, cwd: str):
         if not text:
             continue
 
-        try:
-            content = f"**{category.title()}** (auto-captured): {text}"
-            metadata = {
-                "type": f"auto_{category}",
-                "source": "daemon",
-                "session_id": session_id,
-                "cwd": cwd,
-                "timestamp": datetime.now().isoformat(),
-            }
-            await backboard_client.store_message(thread_id, content, metadata)
+        content = f"**{category.title()}** (auto-captured): {text}"
+        metadata = {
+            "type": f"auto_{category}",
+            "source": "daemon",
+            "session_id": session_id,
+            "cwd": cwd,
+            "timestamp": datetime.now().isoformat(),
+        }
+        to_store.append((category, text, backboard_client.store_message(thread_id, content, metadata)))
+
+    # Send all insights concurrently; one failed store must not drop the rest.
+    # Every outcome is logged before an unexpected error is re-raised.
+    results = await asyncio.gather(*(call for _, _, call in to_store), return_exceptions=True)
+    unexpected = None
+    for (category, text, _), result in zip(to_store, results):
+        if isinstance(result, BaseException):
+            log(f"Failed to store insight: {result}")
+            if unexpected is None and not isinstance(result, BackboardError):
+                unexpected = result
+        else:
             log(f"Stored {category}: {text[:50]}...")
-
-        except BackboardError as e:
-            log(f"Failed to store insight: {e}")
+    if unexpected is not None:
+        raise unexpected
 
 
 # ============ SESSION WATCHING ============
@@ -229,18 +276,21 @@ async def process_session(session_path: Path, state: dict) -> bool:
     # Get tracking state for this session
     session_state = state["sessions"].get(session_id, {
         "last_line": 0,
+        "last_offset": 0,
         "last_extraction": None,
         "pending_messages": 0,
     })
 
     last_line = session_state.get("last_line", 0)
+    last_offset = session_state.get("last_offset", 0)
     last_extraction = session_state.get("last_extraction")
     pending = session_state.get("pending_messages", 0)
 
-    # Get new conversation text
-    conversation, new_last_line = session_parser.get_conversation_text(
+    # Get new conversation text, seeking past lines read on earlier polls
+    conversation, new_last_line, new_last_offset = session_parser.read_conversation(
         session_path,
         since_line=last_line,
+        start_offset=last_offset,
         max_chars=MAX_CHUNK_CHARS
     )
 
@@ -253,6 +303,7 @@ async def process_session(session_path: Path, state: dict) -> bool:
 
     # Update state
     session_state["last_line"] = new_last_line
+    session_state["last_offset"] = new_last_offset
     session_state["pending_messages"] = pending
     state["sessions"][session_id] = session_state
 
@@ -367,10 +418,17 @@ def is_running() -> Optional[int]:
             pid = int(f.read().strip())
 
         # Check if process exists
-        os.kill(pid, 0)
+        if sys.platform == "linux":
+            # A stat of /proc/<pid> skips the signal path; a foreign owner is
+            # what os.kill(pid, 0) would report as PermissionError
+            owner = os.stat(f"/proc/{pid}").st_uid
+            if owner != os.getuid() and os.getuid() != 0:
+                raise PermissionError(pid)
+        else:
+            os.kill(pid, 0)
         return pid
 
-    except (ValueError, ProcessLookupError, PermissionError):
+    except (ValueError, FileNotFoundError, ProcessLookupError, PermissionError):
         # PID file exists but process doesn't
         PID_FILE.unlink(missing_ok=True)
         return None
@@ -466,6 +524,20 @@ def stop_daemon():
         return False
 
 
+def _tail_lines(path: Path, count: int, block_size: int = 4096) -> list[str]:
+    """Return the last `count` lines of a file, reading backwards from the end."""
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        data = b""
+        # One extra newline guarantees the first kept line is complete
+        while pos > 0 and data.count(b"\n") <= count:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    return data.decode("utf-8", errors="replace").splitlines()[-count:]
+
+
 def daemon_status() -> dict:
     """Get daemon status."""
     pid = is_running()
@@ -481,9 +553,7 @@ def daemon_status() -> dict:
 
     if LOG_FILE.exists():
         # Get last few log lines
-        with open(LOG_FILE) as f:
-            lines = f.readlines()
-            status["recent_logs"] = [l.strip() for l in lines[-5:]]
+        status["recent_logs"] = [l.strip() for l in _tail_lines(LOG_FILE, 5)]
 
     return status
 
@@ -12,6 +12,7 @@ across sessions. The handoff file (.flow-guardian/handoff.yaml) contains:
 - timestamp: ISO 8601 format
 - session_id: For daemon tracking (optional)
 """
+import copy
 import os
 import logging
 from pathlib import Path
@@ -20,6 +21,11 @@ from typing import Optional
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
+
 
 # ============ CONSTANTS ============
 
@@ -29,6 +35,9 @@ VALID_STATUSES = {"in_progress", "completed", "blocked"}
 
 logger = logging.getLogger(__name__)
 
+# Parsed handoff files keyed by path; entries hold (st_mtime_ns, st_size, data)
+_LOAD_CACHE: dict[Path, tuple[int, int, Optional[dict]]] = {}
+
 
 # ============ EXCEPTIONS ============
 
@@ -123,17 +132,26 @@ def load_handoff(project_root: Optional[Path] = None) -> Optional[dict]:
         raise HandoffError(f"Permission denied creating {flow_guardian_dir}: {e}")
 
     # Return None if handoff file doesn't exist
-    if not handoff_path.exists():
+    try:
+        stat = handoff_path.stat()
+    except FileNotFoundError:
+        _LOAD_CACHE.pop(handoff_path, None)
         return None
 
+    # Reuse the parsed data while the file is unchanged on disk
+    cached = _LOAD_CACHE.get(handoff_path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return copy.deepcopy(cached[2])
+
     # Load and parse YAML
     try:
         with open(handoff_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
-            # Handle empty file case
-            if data is None:
-                return None
-            return data
+            data = yaml.load(f, Loader=_YamlLoader)
+        _LOAD_CACHE[handoff_path] = (stat.st_mtime_ns, stat.st_size, data)
+        # Handle empty file case
+        if data is None:
+            return None
+        return copy.deepcopy(data)
     except PermissionError as e:
         raise HandoffError(f"Permission denied reading {handoff_path}: {e}")
     except yaml.YAMLError as e:
@@ -211,15 +229,17 @@ def save_handoff(data: dict, project_root: Optional[Path] = None) -> Path:
     temp_path = handoff_path.with_suffix('.yaml.tmp')
     try:
         with open(temp_path, 'w', encoding='utf-8') as f:
-            yaml.safe_dump(
+            yaml.dump(
                 handoff_data,
                 f,
+                Dumper=_YamlDumper,
                 default_flow_style=False,
                 allow_unicode=True,
                 sort_keys=False
             )
         # Atomic rename
         temp_path.replace(handoff_path)
+        _LOAD_CACHE.pop(handoff_path, None)
     except PermissionError as e:
         # Clean up temp file if it exists
         if temp_path.exists():
@@ -301,6 +321,7 @@ def clear_handoff(project_root: Optional[Path] = None) -> bool:
 
     try:
         handoff_path.unlink()
+        _LOAD_CACHE.pop(handoff_path, None)
         return True
     except PermissionError as e:
         raise HandoffError(f"Permission denied deleting {handoff_path}: {e}")
@@ -35,6 +35,15 @@ DEFAULT_LEVEL = "L1"
 INJECTION_HEADER = "<flow-guardian-context>"
 INJECTION_FOOTER = "</flow-guardian-context>"
 
+# Handoff fields shown under "Current Session State", in display order
+_HANDOFF_LINES = (
+    ("goal", "**Goal:** {}"),
+    ("status", "**Status:** {}"),
+    ("now", "**Now:** {}"),
+    ("hypothesis", "**Hypothesis:** {}"),
+    ("branch", "**Branch:** {}"),
+)
+
 
 # ============ CONTEXT GENERATION ============
 
@@ -359,37 +368,16 @@ def format_injection(
     Returns:
         Formatted injection string
     """
-    parts = []
-
-    if not quiet:
-        parts.append(INJECTION_HEADER)
-        parts.append("")
+    parts = [INJECTION_HEADER, ""] if not quiet else []
 
     # Current session state
     if handoff:
-        parts.append("## Current Session State")
-        parts.append("")
-
-        if handoff.get("goal"):
-            parts.append(f"**Goal:** {handoff['goal']}")
-
-        if handoff.get("status"):
-            parts.append(f"**Status:** {handoff['status']}")
-
-        if handoff.get("now"):
-            parts.append(f"**Now:** {handoff['now']}")
-
-        if handoff.get("hypothesis"):
-            parts.append(f"**Hypothesis:** {handoff['hypothesis']}")
-
-        if handoff.get("branch"):
-            parts.append(f"**Branch:** {handoff['branch']}")
+        parts += ("## Current Session State", "")
+        parts += (line.format(handoff[key]) for key, line in _HANDOFF_LINES if handoff.get(key))
 
         files = handoff.get("files", [])
         if files:
-            if level == "L0":
-                parts.append(f"**Files:** {', '.join(files)}")
-            elif level == "L1" and len(files) > 5:
+            if level == "L1" and len(files) > 5:
                 parts.append(f"**Files:** {', '.join(files[:5])} (+{len(files) - 5} more)")
             else:
                 parts.append(f"**Files:** {', '.join(files)}")
@@ -47,22 +47,41 @@ def get_session_path(project_dir: Path, session_id: str) -> Path:
     return project_dir / f"{session_id}.jsonl"
 
 
-def parse_session_messages(session_path: Path, since_line: int = 0) -> Iterator[dict]:
+def parse_session_messages(session_path: Path, since_line: int = 0, start_offset: int = 0) -> Iterator[dict]:
     """
     Parse messages from a session file.
 
     Args:
         session_path: Path to the JSONL session file
         since_line: Skip lines before this (for incremental reading)
+        start_offset: Byte offset where line since_line starts, if known.
+            Seeks straight there instead of scanning the earlier lines;
+            ignored unless the byte before it is a newline (a rewritten
+            file falls back to counting lines from the start).
 
     Yields:
-        Message dicts with role, content, timestamp
+        Message dicts with line, byte offset, role, content, timestamp
     """
     if not session_path.exists():
         return
 
-    with open(session_path) as f:
-        for i, line in enumerate(f):
+    with open(session_path, "rb") as f:
+        on_boundary = False
+        if start_offset and start_offset <= os.fstat(f.fileno()).st_size:
+            f.seek(start_offset - 1)
+            on_boundary = f.read(1) == b"\n"
+
+        if on_boundary:
+            first_line = since_line
+        else:
+            f.seek(0)
+            start_offset = 0
+            first_line = 0
+
+        offset = start_offset
+        for i, line in enumerate(f, start=first_line):
+            line_offset = offset
+            offset += len(line)
             if i < since_line:
                 continue
 
@@ -108,6 +127,7 @@ def parse_session_messages(session_path: Path, since_line: int = 0) -> Iterator[
 
             yield {
                 "line": i,
+                "offset": line_offset,
                 "role": role,
                 "content": content,
                 "session_id": entry.get("sessionId"),
@@ -128,11 +148,35 @@ def get_conversation_text(session_path: Path, since_line: int = 0, max_chars: in
     Returns:
         Tuple of (conversation_text, last_line_processed)
     """
+    text, last_line, _ = read_conversation(session_path, since_line, max_chars=max_chars)
+    return text, last_line
+
+
+def read_conversation(
+    session_path: Path,
+    since_line: int = 0,
+    start_offset: int = 0,
+    max_chars: int = 50000
+) -> tuple[str, int, int]:
+    """
+    Incremental variant of get_conversation_text that also tracks byte offsets.
+
+    Args:
+        session_path: Path to session JSONL
+        since_line: Start from this line
+        start_offset: Byte offset of since_line from a previous call (0 if unknown)
+        max_chars: Maximum characters to return
+
+    Returns:
+        Tuple of (conversation_text, last_line_processed, offset_of_that_line);
+        pass the last two back as since_line/start_offset on the next call
+    """
     lines = []
     last_line = since_line
+    last_offset = start_offset
     total_chars = 0
 
-    for msg in parse_session_messages(session_path, since_line):
+    for msg in parse_session_messages(session_path, since_line, start_offset):
         role = "Human" if msg["role"] == "user" else "Assistant"
         text = f"{role}: {msg['content'][:2000]}"  # Truncate long messages
 
@@ -142,8 +186,9 @@ def get_conversation_text(session_path: Path, since_line: int = 0, max_chars: in
         lines.append(text)
         total_chars += len(text)
         last_line = msg["line"]
+        last_offset = msg["offset"]
 
-    return "\n\n".join(lines), last_line
+    return "\n\n".join(lines), last_line, last_offset
 
 
 def find_all_sessions(cwd: str) -> list[dict]:
@@ -5,6 +5,17 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from services.config import FlowConfig
 from services.flow_service import FlowService
 
+try:
+    import uvloop
+except ImportError:  # Optional: async tests fall back to the default asyncio loop
+    uvloop = None
+
+
+if uvloop is not None:
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
+
 
 @pytest.fixture
 def mock_config():
@@ -86,11 +97,36 @@ def mock_restore():
         yield mock
 
 
-@pytest.fixture
-def api_client(mock_config):
-    """FastAPI TestClient with mocked config."""
-    from fastapi.testclient import TestClient
+@pytest.fixture(scope="session")
+def api_app():
+    """The FastAPI app, imported once per test session."""
     from api.server import app
 
-    app.state.config = mock_config
-    return TestClient(app)
+    return app
+
+
+@pytest.fixture(scope="session")
+def api_test_client(api_app):
+    """TestClient for the API app, built once per test session."""
+    from fastapi.testclient import TestClient
+
+    return TestClient(api_app)
+
+
+@pytest.fixture
+def override_config(api_app):
+    """Replace the API app's config for one test, restoring it on teardown."""
+    original = getattr(api_app.state, "config", None)
+
+    def override(config):
+        api_app.state.config = config
+
+    yield override
+    api_app.state.config = original
+
+
+@pytest.fixture
+def api_client(api_test_client, override_config, mock_config):
+    """Shared FastAPI TestClient with mocked config installed for this test."""
+    override_config(mock_config)
+    return api_test_client
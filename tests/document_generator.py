@@ -10,1014 +10,253 @@ Generates synthetic customer service documents:
 Total: 80 documents
 """
 
-import random
-from dataclasses import dataclass
-from typing import List
-
-
-@dataclass
+import hashlib
+import itertools
+import json
+import math
+import re
+import sys
+import unicodedata
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterator, List, NamedTuple, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # Optional: find_faq falls back to a compiled regex
+    ahocorasick = None
+
+try:
+    import msgspec
+except ImportError:  # Optional: bulk payloads fall back to orjson / json
+    msgspec = None
+
+try:
+    import numpy as np
+except ImportError:  # Optional: BM25 term counting falls back to dicts
+    np = None
+
+try:
+    import orjson
+except ImportError:  # Optional: bulk payloads fall back to the json module
+    orjson = None
+
+
+DATA_DIR = Path(__file__).parent / "data"
+POLICY_DIR = DATA_DIR / "policies"
+
+# Policy bodies held in memory at once; the rest are re-read from disk
+POLICY_CACHE_SIZE = 4
+
+# Print the generation summary; set False to keep fixture setup quiet
+VERBOSE = True
+
+# Boilerplate shared across FAQ answers and policy bodies; the data files
+# reference these as {name} placeholders, expanded once when loaded.
+SNIPPETS = {
+    "support_email": "support@example.com",
+    "support_phone": "1-800-555-0123",
+    "company_address": "123 Commerce Street, Suite 100, New York, NY 10001",
+    "effective_date": "January 1, 2026",
+    "last_updated": "January 15, 2026",
+    "order_history": "Order History",
+    "app_name": "Example Shop",
+}
+
+
+class Category(str, Enum):
+    """Document category; members compare equal to their plain string value."""
+    FAQ = "FAQ"
+    POLICY = "Policy"
+    PRODUCT_GUIDE = "Product Guide"
+    SUPPORT_TICKET = "Support Ticket"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+@dataclass(slots=True, frozen=True, eq=False)
 class Document:
-    """Represents a generated document."""
+    """
+    Represents a generated document.
+
+    Documents compare and hash by content digest, so set(docs) drops
+    documents whose content is identical even when their IDs differ.
+    """
     id: str
-    category: str
+    category: Category
     title: str
     content: str
-    keywords: List[str]
-
-
-# ============================================================
-# FAQ TEMPLATES
-# ============================================================
-
-FAQ_TOPICS = [
-    {
-        "question": "How do I return a product?",
-        "answer": "To return a product, follow these steps:\n1. Log into your account at myaccount.example.com\n2. Navigate to 'Order History'\n3. Select the order containing the item you wish to return\n4. Click 'Request Return' and follow the prompts\n5. Print your prepaid shipping label\n6. Drop off the package at any authorized shipping location\n\nReturns must be initiated within 30 days of delivery. Refunds are processed within 5-7 business days after we receive the item.",
-        "keywords": ["return", "refund", "shipping label", "order history"]
-    },
-    {
-        "question": "What payment methods do you accept?",
-        "answer": "We accept the following payment methods:\n- Visa\n- Mastercard\n- American Express\n- Discover\n- PayPal\n- Apple Pay\n- Google Pay\n- Shop Pay\n- Klarna (buy now, pay later)\n- Affirm financing\n\nAll transactions are secured with 256-bit SSL encryption. We never store your full credit card number on our servers.",
-        "keywords": ["payment", "credit card", "PayPal", "Apple Pay", "financing"]
-    },
-    {
-        "question": "How long does shipping take?",
-        "answer": "Shipping times vary by location and shipping method:\n\n**Standard Shipping (Free over $50)**\n- Continental US: 5-7 business days\n- Alaska/Hawaii: 7-10 business days\n\n**Express Shipping ($12.99)**\n- 2-3 business days nationwide\n\n**Next Day Shipping ($24.99)**\n- Order by 2 PM EST for next-day delivery\n\n**International Shipping**\n- Canada: 7-14 business days\n- Europe: 10-21 business days\n- Rest of World: 14-28 business days",
-        "keywords": ["shipping", "delivery", "express", "international", "tracking"]
-    },
-    {
-        "question": "How do I track my order?",
-        "answer": "To track your order:\n1. Check your email for the shipping confirmation (sent within 24 hours of shipment)\n2. Click the tracking link in the email, or\n3. Log into your account and go to 'Order History'\n4. Click on your order number to see tracking details\n\nYou can also track directly at track.example.com using your order number and email address.",
-        "keywords": ["track", "order", "shipping", "delivery status"]
-    },
-    {
-        "question": "Can I change or cancel my order?",
-        "answer": "Orders can be modified or cancelled within 1 hour of placement. After that, we begin processing and cannot guarantee changes.\n\nTo request a change:\n1. Contact us immediately at support@example.com\n2. Include your order number and requested changes\n3. Our team will respond within 15 minutes during business hours\n\nIf your order has already shipped, you'll need to return it following our standard return process.",
-        "keywords": ["cancel", "change order", "modify", "edit order"]
-    },
-    {
-        "question": "Do you offer price matching?",
-        "answer": "Yes! We offer price matching on identical items from authorized retailers.\n\nRequirements:\n- Item must be identical (same model, color, size)\n- Competitor must be an authorized retailer\n- Price must be current and publicly available\n- Does not apply to clearance, open-box, or auction items\n\nSubmit price match requests to pricematch@example.com with a link to the competitor's listing.",
-        "keywords": ["price match", "competitor", "discount", "best price"]
-    },
-    {
-        "question": "How do I apply a promo code?",
-        "answer": "To apply a promo code:\n1. Add items to your cart\n2. Proceed to checkout\n3. Look for the 'Promo Code' or 'Discount Code' field\n4. Enter your code exactly as shown (codes are case-sensitive)\n5. Click 'Apply'\n\nNote: Only one promo code can be used per order. Promo codes cannot be combined with other offers unless explicitly stated.",
-        "keywords": ["promo code", "discount", "coupon", "apply code"]
-    },
-    {
-        "question": "What is your warranty policy?",
-        "answer": "All products come with manufacturer warranties:\n\n**Electronics**: 1-year limited warranty\n**Furniture**: 5-year structural warranty\n**Appliances**: 2-year parts and labor warranty\n**Accessories**: 90-day warranty\n\nExtended warranties are available at checkout. Warranty claims should be submitted to warranty@example.com with proof of purchase.",
-        "keywords": ["warranty", "guarantee", "coverage", "protection plan"]
-    },
-    {
-        "question": "How do I create an account?",
-        "answer": "Creating an account is easy:\n1. Click 'Sign Up' in the top right corner\n2. Enter your email address\n3. Create a password (min 8 characters, 1 number, 1 special character)\n4. Verify your email by clicking the link we send\n5. Complete your profile (optional)\n\nBenefits of having an account:\n- Faster checkout\n- Order history access\n- Wishlist feature\n- Exclusive member discounts",
-        "keywords": ["account", "sign up", "register", "create account", "login"]
-    },
-    {
-        "question": "How do I reset my password?",
-        "answer": "To reset your password:\n1. Go to the login page\n2. Click 'Forgot Password'\n3. Enter your email address\n4. Check your inbox for the reset link (check spam if not found)\n5. Click the link and create a new password\n\nThe reset link expires after 24 hours. If you don't receive the email, contact support@example.com.",
-        "keywords": ["password", "reset", "forgot password", "login help"]
-    },
-    {
-        "question": "Do you ship internationally?",
-        "answer": "Yes, we ship to over 100 countries worldwide!\n\nInternational shipping details:\n- Duties and taxes are calculated at checkout\n- Some items may be restricted in certain countries\n- Delivery times: 10-28 business days depending on location\n- Tracking is available for all international orders\n\nCheck our shipping page for a full list of supported countries and rates.",
-        "keywords": ["international", "global shipping", "worldwide", "duties", "customs"]
-    },
-    {
-        "question": "What is your exchange policy?",
-        "answer": "Exchanges are easy and free within 30 days:\n1. Request an exchange through your account or contact support\n2. Receive a prepaid shipping label\n3. Ship the original item back\n4. Once received, we'll ship your new item\n\nFor faster exchanges, you can place a new order and return the original item for a refund. Size exchanges ship within 1-2 business days of receiving the return.",
-        "keywords": ["exchange", "swap", "different size", "wrong item"]
-    },
-    {
-        "question": "How do I contact customer support?",
-        "answer": "We're here to help! Contact us via:\n\n**Live Chat**: Available 24/7 on our website\n**Email**: support@example.com (response within 4 hours)\n**Phone**: 1-800-555-0123 (Mon-Fri 8AM-8PM EST, Sat-Sun 10AM-6PM EST)\n**Social Media**: @examplehelp on Twitter/X\n\nFor fastest resolution, have your order number ready.",
-        "keywords": ["contact", "support", "help", "customer service", "phone"]
-    },
-    {
-        "question": "Are your products authentic?",
-        "answer": "Yes, 100% of our products are authentic and sourced directly from manufacturers or authorized distributors.\n\nWe guarantee authenticity on every item. If you ever receive a product you believe is not authentic, contact us immediately for a full refund and free return shipping.\n\nLook for the 'Verified Authentic' badge on product pages.",
-        "keywords": ["authentic", "genuine", "real", "fake", "counterfeit"]
-    },
-    {
-        "question": "How do I leave a product review?",
-        "answer": "We love hearing from customers! To leave a review:\n1. Log into your account\n2. Go to 'Order History'\n3. Find the product you want to review\n4. Click 'Write a Review'\n5. Rate the product (1-5 stars) and write your feedback\n\nReviews are moderated and typically appear within 24-48 hours. As a thank you, you'll receive 50 rewards points for each approved review!",
-        "keywords": ["review", "feedback", "rating", "stars", "comment"]
-    },
-    {
-        "question": "What are rewards points?",
-        "answer": "Our Rewards Program lets you earn points on every purchase!\n\n**Earning Points:**\n- 1 point per $1 spent\n- 50 points for writing a review\n- 100 points for referring a friend\n- 2x points during special promotions\n\n**Redeeming Points:**\n- 100 points = $1 discount\n- Points never expire for active members\n- Redeem at checkout\n\nSign up for free to start earning!",
-        "keywords": ["rewards", "points", "loyalty", "earn points", "redeem"]
-    },
-    {
-        "question": "Do you offer gift cards?",
-        "answer": "Yes! Digital gift cards are available in the following amounts:\n- $25\n- $50\n- $100\n- $200\n- Custom amount (up to $500)\n\nGift cards:\n- Are delivered instantly via email\n- Never expire\n- Can be combined with other payment methods\n- Are non-refundable\n\nPurchase at example.com/giftcards",
-        "keywords": ["gift card", "gift certificate", "present", "give gift"]
-    },
-    {
-        "question": "What if my item arrives damaged?",
-        "answer": "We're sorry if your item arrived damaged! Here's what to do:\n1. Take photos of the damage (item and packaging)\n2. Contact us within 48 hours at damage@example.com\n3. Include your order number and photos\n4. We'll send a replacement or issue a refund immediately\n\nYou don't need to return damaged items - dispose of them safely. We'll also file a claim with the carrier.",
-        "keywords": ["damaged", "broken", "defective", "shipping damage", "replacement"]
-    },
-    {
-        "question": "Can I buy items for business/wholesale?",
-        "answer": "Yes! We offer business and wholesale accounts with special benefits:\n\n**Business Account Benefits:**\n- Net 30 payment terms\n- Volume discounts (10-25% off)\n- Dedicated account manager\n- Priority shipping\n- Custom invoicing\n\nApply at example.com/business or email wholesale@example.com with your business details.",
-        "keywords": ["wholesale", "business", "bulk", "volume discount", "corporate"]
-    },
-    {
-        "question": "How do I unsubscribe from emails?",
-        "answer": "We respect your inbox! To unsubscribe:\n1. Scroll to the bottom of any marketing email\n2. Click 'Unsubscribe' or 'Manage Preferences'\n3. Select which emails you'd like to stop receiving\n4. Click 'Save'\n\nNote: You'll still receive transactional emails (order confirmations, shipping updates) as these are essential for your orders.",
-        "keywords": ["unsubscribe", "email", "marketing", "notifications", "spam"]
-    },
-    {
-        "question": "Is my personal information secure?",
-        "answer": "Your security is our top priority!\n\n**Security Measures:**\n- 256-bit SSL encryption on all pages\n- PCI-DSS compliant payment processing\n- Two-factor authentication available\n- Regular security audits\n- No storage of full credit card numbers\n\nRead our full Privacy Policy at example.com/privacy. We never sell your personal information to third parties.",
-        "keywords": ["security", "privacy", "data protection", "safe", "encryption"]
-    },
-    {
-        "question": "Do you have a mobile app?",
-        "answer": "Yes! Download our free app for the best shopping experience:\n\n**iOS**: Search 'Example Shop' on the App Store\n**Android**: Search 'Example Shop' on Google Play\n\n**App Exclusive Features:**\n- Push notifications for order updates\n- Barcode scanner for easy reorders\n- AR product preview (select items)\n- Exclusive app-only deals\n- Faster checkout with saved info",
-        "keywords": ["app", "mobile", "iPhone", "Android", "download"]
-    },
-    {
-        "question": "What's your sustainability commitment?",
-        "answer": "We're committed to sustainable practices:\n\n**Packaging:**\n- 100% recyclable materials\n- Minimal plastic use\n- Right-sized boxes to reduce waste\n\n**Operations:**\n- Carbon-neutral shipping option at checkout\n- Solar-powered warehouses\n- Recycling programs for old products\n\n**Products:**\n- Eco-friendly product line available\n- Sustainable sourcing standards\n- Product lifecycle assessments\n\nLearn more at example.com/sustainability",
-        "keywords": ["sustainable", "eco-friendly", "green", "environment", "recycling"]
-    },
-    {
-        "question": "Can I schedule a delivery?",
-        "answer": "Yes! Scheduled delivery is available in select areas:\n\n**How to Schedule:**\n1. Choose 'Scheduled Delivery' at checkout\n2. Select your preferred delivery window (2-hour slots)\n3. Available windows shown based on your location\n\n**Cost:** $4.99 for scheduled delivery\n**Availability:** Major metro areas only\n\nYou'll receive a reminder 1 hour before your scheduled window.",
-        "keywords": ["schedule delivery", "delivery window", "appointment", "delivery time"]
-    },
-    {
-        "question": "Do you offer installation services?",
-        "answer": "Yes! Professional installation is available for select products:\n\n**Services Include:**\n- Large appliance installation\n- TV mounting\n- Furniture assembly\n- Smart home setup\n\n**How it Works:**\n1. Add installation service at checkout\n2. A certified technician will contact you within 24 hours\n3. Schedule a convenient time\n4. Installation typically takes 1-2 hours\n\nPricing varies by product and location. See product pages for specific rates.",
-        "keywords": ["installation", "assembly", "setup", "professional install", "mounting"]
-    },
-]
-
-
-# ============================================================
-# POLICY TEMPLATES
-# ============================================================
-
-POLICY_TEMPLATES = [
-    {
-        "title": "Return and Refund Policy",
-        "content": """# Return and Refund Policy
-
-**Effective Date:** January 1, 2026
-**Last Updated:** January 15, 2026
-
-## Overview
-
-We want you to be completely satisfied with your purchase. If you're not happy for any reason, we offer a hassle-free return policy.
-
-## Return Window
-
-- **Standard Items:** 30 days from delivery date
-- **Electronics:** 15 days from delivery date
-- **Holiday Purchases (Nov 1 - Dec 31):** Extended returns until January 31
-
-## Return Conditions
-
-Items must be:
-- In original, unused condition
-- In original packaging with all tags attached
-- Accompanied by proof of purchase (receipt or order confirmation)
-
-## Non-Returnable Items
-
-The following cannot be returned:
-- Personalized or custom items
-- Perishable goods
-- Intimate apparel
-- Hazardous materials
-- Downloaded software
-- Gift cards
-
-## Refund Process
-
-1. **Initiate Return:** Log into your account or contact customer service
-2. **Ship Item:** Use our prepaid label or your own shipping
-3. **Inspection:** We inspect returned items within 2 business days
-4. **Refund Issued:** Refunds processed to original payment method
-
-## Refund Timeline
-
-- **Credit Card:** 5-7 business days
-- **Debit Card:** 5-10 business days
-- **PayPal:** 3-5 business days
-- **Store Credit:** Immediate
-
-## Exchanges
-
-We offer free exchanges for different sizes or colors. Exchange items ship within 1-2 business days of receiving your return.
-
-## Damaged or Defective Items
-
-If you receive a damaged or defective item, contact us within 48 hours. We'll send a replacement at no cost and arrange pickup of the damaged item.
-
-## Questions?
-
-Contact our support team at returns@example.com or call 1-800-555-0123.""",
-        "keywords": ["return policy", "refund", "exchange", "30 days", "money back"]
-    },
-    {
-        "title": "Shipping Policy",
-        "content": """# Shipping Policy
-
-**Effective Date:** January 1, 2026
-
-## Shipping Methods & Rates
-
-### Domestic Shipping (Continental US)
-
-| Method | Delivery Time | Cost |
-|--------|--------------|------|
-| Standard | 5-7 business days | FREE over $50 / $5.99 |
-| Express | 2-3 business days | $12.99 |
-| Next Day | 1 business day | $24.99 |
-| Same Day | Same day (select areas) | $34.99 |
-
-### Alaska, Hawaii & US Territories
-
-| Method | Delivery Time | Cost |
-|--------|--------------|------|
-| Standard | 7-14 business days | $9.99 |
-| Express | 3-5 business days | $19.99 |
-
-### International Shipping
-
-| Region | Delivery Time | Starting Cost |
-|--------|--------------|---------------|
-| Canada | 7-14 business days | $14.99 |
-| Mexico | 10-18 business days | $19.99 |
-| Europe | 10-21 business days | $24.99 |
-| Asia Pacific | 14-28 business days | $29.99 |
-| Rest of World | 14-35 business days | $34.99 |
-
-## Order Processing
-
-- Orders placed before 2 PM EST ship same day
-- Orders placed after 2 PM EST ship next business day
-- Processing does not occur on weekends or holidays
-
-## Tracking Your Order
-
-All orders include tracking. You'll receive:
-1. Order confirmation email (immediately)
-2. Shipping confirmation with tracking number (when shipped)
-3. Delivery confirmation (when delivered)
-
-Track at: track.example.com
-
-## Shipping Restrictions
-
-We cannot ship the following internationally:
-- Lithium batteries (standalone)
-- Aerosols
-- Flammable items
-- Perishables
-- Items over 70 lbs
-
-## Lost or Delayed Packages
-
-If your package is lost or significantly delayed:
-1. Check tracking for latest updates
-2. Contact us after the estimated delivery window
-3. We'll file a claim and send a replacement or refund
-
-## PO Boxes & APO/FPO
-
-We ship to PO Boxes and military addresses via USPS only. Select 'Standard Shipping' at checkout.
-
-## Questions?
-
-Email shipping@example.com or call 1-800-555-0123""",
-        "keywords": ["shipping", "delivery", "tracking", "international", "rates"]
-    },
-    {
-        "title": "Privacy Policy",
-        "content": """# Privacy Policy
-
-**Effective Date:** January 1, 2026
-**Last Updated:** January 15, 2026
-
-## Introduction
-
-Your privacy is important to us. This policy explains how we collect, use, and protect your personal information.
-
-## Information We Collect
-
-### Information You Provide
-- Name and contact information
-- Billing and shipping addresses
-- Payment information
-- Account credentials
-- Communication preferences
-- Survey responses and feedback
-
-### Information Collected Automatically
-- Device information (browser, OS, device type)
-- IP address and location data
-- Browsing behavior on our site
-- Purchase history
-- Cookie data
-
-## How We Use Your Information
-
-We use your information to:
-- Process and fulfill orders
-- Communicate about your orders
-- Send marketing communications (with consent)
-- Improve our products and services
-- Prevent fraud and enhance security
-- Comply with legal obligations
-
-## Information Sharing
-
-We DO NOT sell your personal information. We may share information with:
-- Service providers (payment processors, shipping carriers)
-- Legal authorities when required by law
-- Business partners (with your consent)
-
-## Your Rights
-
-You have the right to:
-- Access your personal data
-- Correct inaccurate data
-- Delete your data ("right to be forgotten")
-- Opt-out of marketing communications
-- Data portability
-- Withdraw consent
-
-## Data Security
-
-We protect your data with:
-- 256-bit SSL encryption
-- PCI-DSS compliant payment processing
-- Regular security audits
-- Employee access controls
-- Secure data centers
-
-## Cookies
-
-We use cookies for:
-- Essential site functionality
-- Analytics and performance
-- Personalization
-- Advertising (with consent)
-
-Manage cookie preferences in your browser settings or our cookie consent tool.
-
-## Children's Privacy
-
-Our site is not intended for children under 13. We do not knowingly collect information from children.
-
-## International Transfers
-
-Data may be transferred to and processed in countries outside your residence. We ensure adequate protection through standard contractual clauses.
-
-## Changes to This Policy
-
-We may update this policy periodically. Changes will be posted on this page with an updated effective date.
-
-## Contact Us
-
-Privacy Officer: privacy@example.com
-Address: 123 Commerce Street, Suite 100, New York, NY 10001
-Phone: 1-800-555-0123""",
-        "keywords": ["privacy", "data protection", "personal information", "cookies", "GDPR"]
-    },
-    {
-        "title": "Terms of Service",
-        "content": """# Terms of Service
-
-**Effective Date:** January 1, 2026
-**Last Updated:** January 15, 2026
-
-## Agreement to Terms
-
-By accessing or using our website, you agree to be bound by these Terms of Service.
-
-## Eligibility
-
-You must be at least 18 years old to use our services. By using our site, you represent that you meet this requirement.
-
-## Account Responsibilities
-
-When you create an account, you agree to:
-- Provide accurate information
-- Maintain the security of your credentials
-- Notify us of unauthorized access
-- Accept responsibility for account activity
-
-## Purchases
-
-### Pricing
-- All prices are in USD unless otherwise stated
-- Prices may change without notice
-- We reserve the right to correct pricing errors
-
-### Order Acceptance
-- Orders are not final until we send confirmation
-- We may refuse or cancel orders at our discretion
-- We may limit quantities
-
-### Payment
-- Payment is due at time of purchase
-- We accept major credit cards, PayPal, and other methods
-- You authorize us to charge your payment method
-
-## Intellectual Property
-
-All content on our site is protected by:
-- Copyright
-- Trademark
-- Trade dress
-- Other intellectual property rights
-
-You may not copy, reproduce, or distribute our content without permission.
-
-## User Conduct
-
-You agree NOT to:
-- Violate any laws or regulations
-- Infringe on intellectual property rights
-- Transmit viruses or malicious code
-- Attempt unauthorized access to our systems
-- Harass or harm other users
-- Use bots or automated systems without permission
-
-## Limitation of Liability
-
-TO THE MAXIMUM EXTENT PERMITTED BY LAW:
-- We provide services "as is" without warranties
-- We are not liable for indirect, incidental, or consequential damages
-- Our liability is limited to the amount you paid for the product/service
-
-## Indemnification
-
-You agree to indemnify and hold us harmless from claims arising from:
-- Your use of our services
-- Your violation of these terms
-- Your violation of third-party rights
-
-## Dispute Resolution
-
-Disputes will be resolved through:
-1. Informal negotiation (30 days)
-2. Binding arbitration in New York, NY
-3. Class action waiver applies
-
-## Termination
-
-We may terminate your account at any time for any reason. You may terminate by contacting us.
-
-## Changes to Terms
-
-We may modify these terms at any time. Continued use constitutes acceptance of changes.
-
-## Contact
-
-Legal Department: legal@example.com
-Address: 123 Commerce Street, Suite 100, New York, NY 10001""",
-        "keywords": ["terms", "conditions", "agreement", "legal", "liability"]
-    },
-    {
-        "title": "Warranty Policy",
-        "content": """# Warranty Policy
-
-**Effective Date:** January 1, 2026
-
-## Standard Warranty Coverage
-
-All products sold through our platform include manufacturer warranties:
-
-### Electronics
-- **Duration:** 1 year from purchase date
-- **Coverage:** Manufacturing defects, component failures
-- **Excludes:** Physical damage, water damage, unauthorized modifications
-
-### Furniture
-- **Duration:** 5 years (structural), 1 year (fabric/upholstery)
-- **Coverage:** Frame defects, joinery failures, mechanism defects
-- **Excludes:** Normal wear, fading, pet damage
-
-### Appliances
-- **Duration:** 2 years parts and labor
-- **Coverage:** Mechanical failures, electrical defects
-- **Excludes:** Cosmetic damage, user damage, power surges
-
-### Accessories
-- **Duration:** 90 days
-- **Coverage:** Manufacturing defects
-- **Excludes:** Normal wear and tear
-
-## Extended Warranty Options
-
-Extend your protection with our extended warranty plans:
-
-| Product Category | 2-Year Extension | 3-Year Extension |
-|-----------------|------------------|------------------|
-| Electronics | $49.99 | $79.99 |
-| Appliances | $79.99 | $129.99 |
-| Furniture | $99.99 | $149.99 |
-
-Benefits of extended warranty:
-- No deductibles
-- Covers accidental damage (optional add-on)
-- Free shipping for repairs
-- Replacement if unrepairable
-
-## How to Make a Warranty Claim
+    keywords: FrozenSet[str]  # lower-cased
+    content_utf8: bytes = field(init=False, repr=False)
+    content_sha256: bytes = field(init=False, repr=False)
+    content_normalized: str = field(init=False, repr=False)  # lower-cased ASCII
 
-1. **Contact Us:** warranty@example.com or 1-800-555-0123
-2. **Provide:** Order number, product details, description of issue, photos if applicable
-3. **Assessment:** We'll review within 2 business days
-4. **Resolution:** Repair, replacement, or refund depending on the issue
+    def __post_init__(self):
+        # Encode, hash and normalize once at construction; bulk indexers reuse all three
+        content_utf8 = self.content.encode("utf-8")
+        object.__setattr__(self, "content_utf8", content_utf8)
+        object.__setattr__(self, "content_sha256", hashlib.sha256(content_utf8).digest())
+        object.__setattr__(self, "content_normalized", _fold(self.content))
 
-## Warranty Exclusions
+    def __eq__(self, other):
+        if not isinstance(other, Document):
+            return NotImplemented
+        return self.content_sha256 == other.content_sha256
 
-Warranties do not cover:
-- Damage from misuse or abuse
-- Unauthorized repairs or modifications
-- Cosmetic damage (scratches, dents)
-- Natural disasters
-- Commercial use (unless business warranty purchased)
-- Products purchased from unauthorized resellers
+    def __hash__(self):
+        return int.from_bytes(self.content_sha256[:8], "little")
 
-## Manufacturer vs. Retailer Warranty
 
-Some products may be covered by both manufacturer and retailer warranties. We recommend:
-1. First contact us for fastest resolution
-2. Manufacturer warranty may offer additional coverage
-3. Keep your receipt and warranty documentation
+@lru_cache(maxsize=None)
+def _fold(text: str) -> str:
+    """Lower-case text and strip accents, e.g. "Café" -> "cafe"."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return decomposed.encode("ascii", "ignore").decode("ascii")
 
-## Questions?
 
-Warranty Department: warranty@example.com
-Phone: 1-800-555-0123
-Hours: Mon-Fri 8AM-6PM EST""",
-        "keywords": ["warranty", "guarantee", "protection", "coverage", "extended warranty"]
-    },
-    {
-        "title": "Accessibility Statement",
-        "content": """# Accessibility Statement
-
-**Last Updated:** January 15, 2026
-
-## Our Commitment
-
-We are committed to ensuring digital accessibility for people with disabilities. We continually improve the user experience for everyone and apply relevant accessibility standards.
-
-## Standards
-
-Our website aims to conform to:
-- Web Content Accessibility Guidelines (WCAG) 2.1 Level AA
-- Americans with Disabilities Act (ADA)
-- Section 508 of the Rehabilitation Act
-
-## Accessibility Features
-
-### Visual
-- Alt text for all images
-- Sufficient color contrast (4.5:1 minimum)
-- Resizable text up to 200%
-- No content that flashes more than 3 times per second
-
-### Navigation
-- Keyboard-accessible navigation
-- Skip-to-content links
-- Consistent navigation structure
-- Descriptive link text
-
-### Content
-- Clear headings and structure
-- Simple, clear language
-- Captions for videos
-- Transcripts for audio content
-
-### Assistive Technology
-- Compatible with screen readers
-- ARIA labels where appropriate
-- Form labels and error messages
-- Focus indicators
-
-## Browser Compatibility
-
-Our site is tested with:
-- Chrome (latest 2 versions)
-- Firefox (latest 2 versions)
-- Safari (latest 2 versions)
-- Edge (latest 2 versions)
-
-Screen reader tested:
-- JAWS
-- NVDA
-- VoiceOver
-
-## Known Issues
-
-We're actively working to address:
-- Some PDF documents may not be fully accessible
-- Third-party content may have accessibility limitations
-- Some older product images lack detailed alt text
-
-## Feedback
-
-We welcome your feedback on accessibility. Please contact us:
-- Email: accessibility@example.com
-- Phone: 1-800-555-0123 (TTY available)
-- Mail: Accessibility Coordinator, 123 Commerce Street, Suite 100, New York, NY 10001
-
-We aim to respond within 3 business days.
-
-## Continuous Improvement
-
-We conduct:
-- Regular accessibility audits
-- User testing with assistive technologies
-- Staff accessibility training
-- Third-party accessibility reviews""",
-        "keywords": ["accessibility", "ADA", "WCAG", "screen reader", "disabilities"]
-    },
-    {
-        "title": "Cookie Policy",
-        "content": """# Cookie Policy
-
-**Effective Date:** January 1, 2026
-
-## What Are Cookies?
-
-Cookies are small text files stored on your device when you visit websites. They help sites remember information about your visit.
-
-## Types of Cookies We Use
-
-### Essential Cookies
-**Purpose:** Required for basic site functionality
-**Examples:**
-- Shopping cart contents
-- Login session
-- Security tokens
-
-These cannot be disabled as they're necessary for the site to work.
-
-### Analytics Cookies
-**Purpose:** Help us understand how visitors use our site
-**Provider:** Google Analytics
-**Data Collected:**
-- Pages visited
-- Time on site
-- Device information
-- Geographic location (city level)
-
-### Functionality Cookies
-**Purpose:** Remember your preferences
-**Examples:**
-- Language preference
-- Display settings
-- Recently viewed items
-
-### Advertising Cookies
-**Purpose:** Deliver relevant ads and measure campaign effectiveness
-**Providers:** Google Ads, Facebook Pixel, etc.
-**Data Collected:**
-- Browsing behavior
-- Purchase history
-- Ad interactions
-
-## Cookie Duration
-
-- **Session Cookies:** Deleted when you close your browser
-- **Persistent Cookies:** Remain for a set period (1 day to 2 years)
-
-## Managing Cookies
-
-### Browser Settings
-You can control cookies through your browser settings:
-- Chrome: Settings > Privacy and Security > Cookies
-- Firefox: Options > Privacy & Security > Cookies
-- Safari: Preferences > Privacy > Cookies
-- Edge: Settings > Cookies and Site Permissions
-
-### Our Cookie Consent Tool
-Click "Cookie Preferences" in the footer to manage your choices.
-
-### Opt-Out Links
-- Google Analytics: tools.google.com/dlpage/gaoptout
-- Facebook: facebook.com/settings/?tab=ads
-
-## Third-Party Cookies
-
-Some cookies are placed by third parties. We don't control these cookies. See their privacy policies:
-- Google: policies.google.com/privacy
-- Facebook: facebook.com/policy.php
-
-## Impact of Disabling Cookies
-
-If you disable cookies:
-- Some features may not work properly
-- You'll need to log in each visit
-- Your preferences won't be saved
-- You may see less relevant ads
-
-## Updates to This Policy
-
-We may update this policy periodically. Check this page for the latest version.
-
-## Contact Us
-
-Privacy Team: privacy@example.com
-Phone: 1-800-555-0123""",
-        "keywords": ["cookies", "tracking", "privacy", "consent", "advertising"]
-    },
-    {
-        "title": "Payment Security Policy",
-        "content": """# Payment Security Policy
-
-**Effective Date:** January 1, 2026
-
-## Our Security Commitment
-
-We use industry-leading security measures to protect your payment information.
-
-## Security Certifications
-
-- **PCI DSS Level 1:** Highest level of payment card security
-- **SSL/TLS Encryption:** 256-bit encryption on all transactions
-- **3D Secure:** Additional authentication for card payments
-
-## How We Protect Your Data
-
-### During Transmission
-- All data encrypted with TLS 1.3
-- Secure HTTPS connection (look for padlock icon)
-- Certificate transparency logging
-
-### Storage
-- We never store full credit card numbers
-- Only last 4 digits retained for reference
-- Tokenization for recurring payments
-- Data encrypted at rest
-
-### Access Control
-- Role-based access for employees
-- Multi-factor authentication required
-- Regular access audits
-- Minimal data access principle
-
-## Payment Methods Security
-
-### Credit/Debit Cards
-- CVV required for all transactions
-- Address verification (AVS)
-- 3D Secure authentication when available
-
-### PayPal
-- You're redirected to PayPal's secure site
-- We never see your PayPal password
-- Protected by PayPal's security policies
-
-### Digital Wallets
-- Apple Pay, Google Pay use tokenization
-- Biometric authentication on your device
-- No card details transmitted to merchants
-
-## Fraud Prevention
-
-We employ multiple fraud detection measures:
-- Real-time transaction monitoring
-- Machine learning fraud detection
-- Manual review of suspicious orders
-- Velocity checks
-- Device fingerprinting
-
-## Your Responsibilities
-
-To keep your account secure:
-- Use a strong, unique password
-- Enable two-factor authentication
-- Don't share your credentials
-- Monitor your statements
-- Report suspicious activity immediately
-
-## Reporting Security Concerns
-
-If you notice suspicious activity:
-- Email: security@example.com
-- Phone: 1-800-555-0123 (24/7 fraud line)
-- In-app: Report through your account settings
-
-## Compliance
-
-We comply with:
-- PCI DSS
-- GDPR (for EU customers)
-- CCPA (for California customers)
-- State data breach notification laws
-
-## Questions?
-
-Security Team: security@example.com
-Phone: 1-800-555-0123""",
-        "keywords": ["payment security", "PCI", "encryption", "fraud protection", "secure checkout"]
-    },
-    {
-        "title": "Price Adjustment Policy",
-        "content": """# Price Adjustment Policy
-
-**Effective Date:** January 1, 2026
-
-## Price Adjustment Eligibility
-
-If an item you purchased goes on sale within 14 days of your purchase, we'll refund the difference!
-
-## Requirements
-
-To receive a price adjustment:
-1. Original purchase must be within 14 days
-2. Item must be the exact same product (same SKU)
-3. Item must be in stock at the new price
-4. Request must be made within the 14-day window
-
-## How to Request
-
-### Online
-1. Log into your account
-2. Go to Order History
-3. Select the order
-4. Click "Request Price Adjustment"
-5. We'll process within 24-48 hours
-
-### Phone
-Call 1-800-555-0123 with:
-- Order number
-- Item details
-- Current sale price
-
-## Refund Method
-
-- Adjustments credited to original payment method
-- Processing time: 3-5 business days
-- You'll receive confirmation email
-
-## Exclusions
-
-Price adjustments do NOT apply to:
-- Clearance or final sale items
-- Limited-time flash sales (under 24 hours)
-- Coupon or promo code discounts
-- Bundle deals
-- Gift card purchases
-- Price errors
-- Competitor prices (see Price Match policy)
-
-## Automatic Price Protection
-
-For orders with our Price Protection Plan ($4.99):
-- Automatic monitoring for 30 days
-- Automatic refund if price drops
-- No action required from you
-
-## Price Match vs. Price Adjustment
-
-| Feature | Price Adjustment | Price Match |
-|---------|-----------------|-------------|
-| Timeframe | 14 days after purchase | Before purchase |
-| Source | Our site only | Competitor prices |
-| Process | Easy, online | Requires verification |
-
-## Frequently Asked Questions
-
-**Q: Can I combine price adjustment with a coupon?**
-A: No, we adjust to the lowest advertised price only.
-
-**Q: What if I used a coupon on my original purchase?**
-A: We'll compare your paid price to the new sale price.
-
-**Q: Is there a limit on adjustments?**
-A: One adjustment per item per order.
-
-## Contact
-
-Customer Service: priceadjust@example.com
-Phone: 1-800-555-0123""",
-        "keywords": ["price adjustment", "price drop", "sale price", "refund difference", "price protection"]
-    },
-    {
-        "title": "Loyalty Program Terms",
-        "content": """# Loyalty Program Terms & Conditions
-
-**Program Name:** Rewards Plus
-**Effective Date:** January 1, 2026
-
-## Program Overview
-
-Rewards Plus is our free loyalty program that lets you earn points on purchases and redeem them for discounts.
-
-## Enrollment
-
-- Free to join
-- Must be 18 or older
-- One account per person
-- Requires valid email address
-
-## Earning Points
-
-### Standard Earning
-- 1 point per $1 spent on eligible purchases
-- Points credited after order ships
-
-### Bonus Earning Opportunities
-- 50 points: Write a product review
-- 100 points: Refer a friend who makes a purchase
-- 200 points: Birthday bonus (once per year)
-- 2x points: During promotional periods
-- 5x points: On your membership anniversary
-
-### Ineligible for Points
-- Gift card purchases
-- Shipping fees
-- Taxes
-- Items purchased with 100% rewards
-
-## Membership Tiers
-
-| Tier | Annual Spend | Benefits |
-|------|-------------|----------|
-| Member | $0+ | 1x points, member prices |
-| Silver | $500+ | 1.25x points, early access |
-| Gold | $1,000+ | 1.5x points, free express shipping |
-| Platinum | $2,500+ | 2x points, exclusive events, personal shopper |
-
-Tier status resets annually on January 1.
+@dataclass(slots=True, frozen=True)
+class Policy:
+    """A policy template; the markdown body is loaded lazily from disk."""
+    title: str
+    slug: str
+    keywords: FrozenSet[str]
 
-## Redeeming Points
+    @property
+    def content(self) -> str:
+        return get_policy_content(self.slug)
 
-### Conversion Rate
-- 100 points = $1 discount
 
-### Minimum Redemption
-- 500 points ($5) minimum
+class TemplateRec(NamedTuple):
+    """A product guide or support ticket template."""
+    title: str
+    content: str
+    keywords: Tuple[str, ...]
 
-### How to Redeem
-1. Add items to cart
-2. Proceed to checkout
-3. Click "Apply Rewards Points"
-4. Enter points to redeem
-5. Discount applied automatically
 
-### Redemption Restrictions
-- Cannot be combined with some promotions
-- No cash value
-- Cannot be applied to previous purchases
-- Gift cards excluded from redemption purchases
+class FaqRec(NamedTuple):
+    """An FAQ template."""
+    question: str
+    answer: str
+    keywords: Tuple[str, ...]
 
-## Points Expiration
 
-- Points expire 24 months after earning
-- Tier benefits do not extend points
-- Check your point balance in your account
+def _template_recs(raw: List[dict]) -> Tuple[TemplateRec, ...]:
+    """Freeze template dict literals into a tuple of TemplateRec."""
+    return tuple(
+        TemplateRec(t["title"], t["content"], tuple(t["keywords"])) for t in raw
+    )
 
-## Account Management
 
-- View points balance online or in app
-- Track earning and redemption history
-- Update contact preferences
-- Manage communication settings
+# ============================================================
+# FAQ TEMPLATES
+# ============================================================
 
-## Program Changes
+def _load_faq_topics() -> Tuple[FaqRec, ...]:
+    """Load FAQ topics from JSON and expand shared snippets in each answer."""
+    topics = json.loads((DATA_DIR / "faq_topics.json").read_text(encoding="utf-8"))
+    return tuple(
+        FaqRec(
+            faq["question"],
+            faq["answer"].format_map(SNIPPETS),
+            tuple(faq["keywords"]),
+        )
+        for faq in topics
+    )
 
-We reserve the right to:
-- Modify point earning rates
-- Change tier requirements
-- Update redemption values
-- Terminate the program with 30 days notice
 
-## Termination
+# FAQ_TOPICS is loaded from JSON on first access; see _faq_index() below.
 
-We may terminate membership for:
-- Fraudulent activity
-- Violation of terms
-- Account inactivity (24+ months)
 
-## Contact
+# ============================================================
+# POLICY TEMPLATES
+# ============================================================
 
-Rewards Support: rewards@example.com
-Phone: 1-800-555-0123""",
-        "keywords": ["loyalty program", "rewards", "points", "membership", "tiers"]
-    },
-]
+# Policies are stored as parallel tuples (structure of arrays), index-aligned.
+# Bodies live in data/policies/<slug>.md and are read on demand. This module
+# is test-fixture data loaded by a single process, so there is no multi-worker
+# sharing to justify a serialized zero-copy blob format.
+#
+# Titles and keywords are interned so repeated strings share one object and
+# dict/equality checks can short-circuit on identity.
+POLICY_TITLES = tuple(map(sys.intern, (
+    "Return and Refund Policy",
+    "Shipping Policy",
+    "Privacy Policy",
+    "Terms of Service",
+    "Warranty Policy",
+    "Accessibility Statement",
+    "Cookie Policy",
+    "Payment Security Policy",
+    "Price Adjustment Policy",
+    "Loyalty Program Terms",
+)))
+
+POLICY_SLUGS = (
+    "return_refund",
+    "shipping",
+    "privacy",
+    "terms_of_service",
+    "warranty",
+    "accessibility",
+    "cookies",
+    "payment_security",
+    "price_adjustment",
+    "loyalty_program",
+)
+
+POLICY_KEYWORDS = tuple(tuple(map(sys.intern, kws)) for kws in (
+    ("return policy", "refund", "exchange", "30 days", "money back"),
+    ("shipping", "delivery", "tracking", "international", "rates"),
+    ("privacy", "data protection", "personal information", "cookies", "GDPR"),
+    ("terms", "conditions", "agreement", "legal", "liability"),
+    ("warranty", "guarantee", "protection", "coverage", "extended warranty"),
+    ("accessibility", "ADA", "WCAG", "screen reader", "disabilities"),
+    ("cookies", "tracking", "privacy", "consent", "advertising"),
+    ("payment security", "PCI", "encryption", "fraud protection", "secure checkout"),
+    ("price adjustment", "price drop", "sale price", "refund difference", "price protection"),
+    ("loyalty program", "rewards", "points", "membership", "tiers"),
+))
+
+# POLICY_TEMPLATES (a tuple of Policy records) and the policy lookup indexes
+# are built on first access; see _policy_index() below.
+
+
+def get_policy(index: int) -> Policy:
+    """Return the policy record at an index."""
+    return Policy(POLICY_TITLES[index], POLICY_SLUGS[index], frozenset(POLICY_KEYWORDS[index]))
+
+
+@lru_cache(maxsize=POLICY_CACHE_SIZE)
+def get_policy_content(slug: str) -> str:
+    """Return the rendered markdown body for a policy, keeping recently used ones in memory."""
+    template = (POLICY_DIR / f"{slug}.md").read_text(encoding="utf-8")
+    return template.format_map(SNIPPETS)
+
+
+@lru_cache(maxsize=POLICY_CACHE_SIZE)
+def get_policy_http(slug: str) -> Tuple[bytes, str, int]:
+    """
+    Return a policy body ready to serve over HTTP: (body, etag, content_length).
+
+    The POLICY_CACHE_SIZE most recently served slugs skip the str -> bytes
+    encode and the ETag hash. The ETag is quoted and interned so
+    If-None-Match checks can compare by identity first.
+    """
+    body = get_policy_content(slug).encode("utf-8")
+    etag = sys.intern(f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"')
+    return body, etag, len(body)
 
 
 # ============================================================
 # PRODUCT GUIDE TEMPLATES
 # ============================================================
 
-PRODUCT_GUIDE_TEMPLATES = [
+PRODUCT_GUIDE_TEMPLATES = _template_recs([
     {
         "title": "Getting Started with Smart Home Hub",
         "content": """# Getting Started with Smart Home Hub
@@ -1606,14 +845,14 @@ Still having issues?
 - Video guides: example.com/vacuum-help""",
         "keywords": ["robot vacuum", "troubleshooting", "error codes", "cleaning", "maintenance"]
     },
-]
+])
 
 
 # ============================================================
 # SUPPORT TICKET TEMPLATES
 # ============================================================
 
-SUPPORT_TICKET_TEMPLATES = [
+SUPPORT_TICKET_TEMPLATES = _template_recs([
     {
         "title": "Ticket #45892: Order Delivered to Wrong Address",
         "content": """# Support Ticket #45892
@@ -1941,101 +1180,232 @@ Price match APPROVED
 ## Resolution Time: 30 minutes""",
         "keywords": ["price match", "competitor price", "discount", "TV", "price guarantee"]
     },
-]
+])
 
 
 # ============================================================
 # GENERATOR FUNCTIONS
 # ============================================================
 
-def generate_faq_documents() -> List[Document]:
-    """Generate FAQ documents from templates."""
-    docs = []
-    for i, faq in enumerate(FAQ_TOPICS):
-        doc = Document(
-            id=f"FAQ-{i+1:03d}",
-            category="FAQ",
-            title=f"FAQ: {faq['question']}",
-            content=f"**Question:** {faq['question']}\n\n**Answer:**\n{faq['answer']}",
-            keywords=faq["keywords"]
-        )
-        docs.append(doc)
-    return docs
-
-
-def generate_policy_documents() -> List[Document]:
-    """Generate policy documents from templates."""
-    docs = []
-    for i, policy in enumerate(POLICY_TEMPLATES):
-        doc = Document(
-            id=f"POL-{i+1:03d}",
-            category="Policy",
-            title=policy["title"],
-            content=policy["content"],
-            keywords=policy["keywords"]
+@lru_cache(maxsize=None)
+def _doc_ids(prefix: str, count: int) -> Tuple[str, ...]:
+    """Return the ID table PREFIX-001 .. PREFIX-<count>, formatted once."""
+    return tuple(f"{prefix}-{n:03d}" for n in range(1, count + 1))
+
+
+def _make_document(doc_id: str, category: Category, title: str, content: str, keywords) -> Document:
+    """Build a Document with its keywords lower-cased into a frozenset."""
+    return Document(
+        id=doc_id,
+        category=category,
+        title=title,
+        content=content,
+        keywords=frozenset(kw.lower() for kw in keywords),
+    )
+
+
+# Each group generator runs once per process (lru_cache) and later calls
+# return the cached tuple, so exec-generated per-template builders would
+# only speed up a one-off loop over 45 templates.
+@lru_cache(maxsize=1)
+def generate_faq_documents() -> Tuple[Document, ...]:
+    """Generate FAQ documents from templates (built once, then cached)."""
+    topics = _faq_index().topics
+    ids = _doc_ids("FAQ", len(topics))
+    return tuple(
+        _make_document(
+            ids[i],
+            Category.FAQ,
+            f"FAQ: {faq.question}",
+            f"**Question:** {faq.question}\n\n**Answer:**\n{faq.answer}",
+            faq.keywords,
         )
-        docs.append(doc)
-    return docs
-
-
-def generate_product_guides() -> List[Document]:
-    """Generate product guide documents from templates."""
-    docs = []
-    for i, guide in enumerate(PRODUCT_GUIDE_TEMPLATES):
-        doc = Document(
-            id=f"GUIDE-{i+1:03d}",
-            category="Product Guide",
-            title=guide["title"],
-            content=guide["content"],
-            keywords=guide["keywords"]
+        for i, faq in enumerate(topics)
+    )
+
+
+@lru_cache(maxsize=1)
+def generate_policy_documents() -> Tuple[Document, ...]:
+    """Generate policy documents from templates (built once, then cached)."""
+    templates = _policy_index().templates
+    ids = _doc_ids("POL", len(templates))
+    return tuple(
+        _make_document(ids[i], Category.POLICY, policy.title, policy.content, policy.keywords)
+        for i, policy in enumerate(templates)
+    )
+
+
+@lru_cache(maxsize=1)
+def generate_product_guides() -> Tuple[Document, ...]:
+    """Generate product guide documents from templates (built once, then cached)."""
+    ids = _doc_ids("GUIDE", len(PRODUCT_GUIDE_TEMPLATES))
+    return tuple(
+        _make_document(
+            ids[i], Category.PRODUCT_GUIDE, guide.title, guide.content, guide.keywords
         )
-        docs.append(doc)
-    return docs
-
-
-def generate_support_tickets() -> List[Document]:
-    """Generate support ticket documents from templates."""
-    docs = []
-    for i, ticket in enumerate(SUPPORT_TICKET_TEMPLATES):
-        doc = Document(
-            id=f"TICKET-{i+1:03d}",
-            category="Support Ticket",
-            title=ticket["title"],
-            content=ticket["content"],
-            keywords=ticket["keywords"]
+        for i, guide in enumerate(PRODUCT_GUIDE_TEMPLATES)
+    )
+
+
+@lru_cache(maxsize=1)
+def generate_support_tickets() -> Tuple[Document, ...]:
+    """Generate support ticket documents from templates (built once, then cached)."""
+    ids = _doc_ids("TICKET", len(SUPPORT_TICKET_TEMPLATES))
+    return tuple(
+        _make_document(
+            ids[i], Category.SUPPORT_TICKET, ticket.title, ticket.content, ticket.keywords
         )
-        docs.append(doc)
-    return docs
+        for i, ticket in enumerate(SUPPORT_TICKET_TEMPLATES)
+    )
 
 
-def generate_all_documents() -> List[Document]:
-    """Generate all document types."""
-    all_docs = []
+# Generator for each document type, in output order
+_DOCUMENT_GROUPS = (
+    generate_faq_documents,
+    generate_policy_documents,
+    generate_product_guides,
+    generate_support_tickets,
+)
 
-    print("Generating FAQ documents...")
-    all_docs.extend(generate_faq_documents())
 
-    print("Generating policy documents...")
-    all_docs.extend(generate_policy_documents())
+def iter_all_documents() -> Iterator[Document]:
+    """
+    Yield documents of every type, skipping templates with duplicate content.
 
-    print("Generating product guides...")
-    all_docs.extend(generate_product_guides())
+    Output order is FAQ, policy, guide, ticket; each group is generated (and
+    cached) only when iteration reaches it.
+    """
+    seen = set()
+    for generate in _DOCUMENT_GROUPS:
+        for doc in generate():
+            if doc.content_sha256 in seen:
+                continue
+            seen.add(doc.content_sha256)
+            yield doc
 
-    print("Generating support tickets...")
-    all_docs.extend(generate_support_tickets())
 
-    print(f"\nTotal documents generated: {len(all_docs)}")
-    print(f"  - FAQs: {len(FAQ_TOPICS)}")
-    print(f"  - Policies: {len(POLICY_TEMPLATES)}")
-    print(f"  - Product Guides: {len(PRODUCT_GUIDE_TEMPLATES)}")
-    print(f"  - Support Tickets: {len(SUPPORT_TICKET_TEMPLATES)}")
+def generate_all_documents() -> List[Document]:
+    """Generate all document types, skipping templates with duplicate content."""
+    all_docs = list(iter_all_documents())
+    skipped = sum(len(generate()) for generate in _DOCUMENT_GROUPS) - len(all_docs)
+
+    if VERBOSE:
+        lines = [f"Total documents generated: {len(all_docs)}"]
+        if skipped:
+            lines.append(f"  - Duplicates skipped: {skipped}")
+        lines += [
+            f"  - FAQs: {len(_faq_index().topics)}",
+            f"  - Policies: {len(_policy_index().templates)}",
+            f"  - Product Guides: {len(PRODUCT_GUIDE_TEMPLATES)}",
+            f"  - Support Tickets: {len(SUPPORT_TICKET_TEMPLATES)}",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
 
     return all_docs
 
 
-def get_test_queries() -> List[dict]:
-    """Return test queries with expected keywords to verify retrieval."""
-    return [
+# Elasticsearch recommends bulk requests of a few megabytes
+BULK_PAYLOAD_BYTES = 5_000_000
+
+
+_MSGSPEC_ENCODER = msgspec.json.Encoder() if msgspec is not None else None
+
+
+# Index mapping for iter_bulk_payloads(). content_normalized is folded at
+# generation time, so the keyword analyzer indexes it without further work.
+ES_MAPPING = {
+    "properties": {
+        "category": {"type": "keyword"},
+        "title": {"type": "text"},
+        "content": {"type": "text"},
+        "content_normalized": {"type": "text", "analyzer": "keyword"},
+        "keywords": {"type": "keyword"},
+    }
+}
+
+
+def _dumps(obj) -> bytes:
+    """Serialize obj to compact UTF-8 JSON with the fastest encoder available."""
+    if _MSGSPEC_ENCODER is not None:
+        return _MSGSPEC_ENCODER.encode(obj)
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _bulk_lines(doc: Document) -> bytes:
+    """Return the NDJSON action and source lines indexing doc."""
+    action = b'{"index":{"_id":' + _dumps(doc.id) + b"}}\n"
+    source = _dumps({
+        "category": doc.category.value,
+        "title": doc.title,
+        "content": doc.content,
+        "content_normalized": doc.content_normalized,
+        "keywords": sorted(doc.keywords),
+    })
+    return action + source + b"\n"
+
+
+def iter_bulk_payloads(max_bytes: int = BULK_PAYLOAD_BYTES) -> Iterator[bytes]:
+    """
+    Yield pre-serialized Elasticsearch _bulk request bodies.
+
+    Each payload holds whole action/source line pairs and stays within
+    max_bytes unless a single document is larger on its own.
+    """
+    payload = bytearray()
+    for doc in iter_all_documents():
+        lines = _bulk_lines(doc)
+        if payload and len(payload) + len(lines) > max_bytes:
+            yield bytes(payload)
+            payload.clear()
+        payload += lines
+    if payload:
+        yield bytes(payload)
+
+
+def documents_by_category(docs: List[Document]) -> Dict[Category, List[Document]]:
+    """Group docs by category so searches can be scoped to one type."""
+    by_category = {category: [] for category in Category}
+    for doc in docs:
+        by_category[doc.category].append(doc)
+    return by_category
+
+
+def build_keyword_index(docs: List[Document]) -> Dict[str, array]:
+    """
+    Build an inverted index from keyword to positions in docs.
+
+    Posting lists are array('i') (C int32) rather than lists of Python ints,
+    so keyword filtering walks compact contiguous storage.
+    """
+    index = {}
+    for i, doc in enumerate(docs):
+        for kw in doc.keywords:
+            postings = index.get(kw)
+            if postings is None:
+                postings = index[kw] = array("i")
+            postings.append(i)
+    return index
+
+
+class Query(NamedTuple):
+    """A retrieval test query and the keywords its results should carry."""
+    query: str
+    expected_keywords: FrozenSet[str]  # lower-cased
+    category: Category
+
+
+@lru_cache(maxsize=1)
+def get_test_queries() -> Tuple[Query, ...]:
+    """
+    Return test queries with expected keywords to verify retrieval.
+
+    Built once and cached; the records are immutable so callers cannot
+    corrupt the shared tuple. expected_keywords is a lower-cased frozenset
+    so it can be intersected directly with Document.keywords.
+    """
+    queries = [
         # FAQ queries
         {"query": "How do I return a product I purchased?", "expected_keywords": ["return", "refund"], "category": "FAQ"},
         {"query": "What payment methods are accepted?", "expected_keywords": ["payment", "credit card", "PayPal"], "category": "FAQ"},
@@ -2064,6 +1434,364 @@ def get_test_queries() -> List[dict]:
         {"query": "I can't log into my account and password reset isn't working", "expected_keywords": ["account access", "password reset"], "category": "Support Ticket"},
         {"query": "Can I get a price match after seeing a competitor's lower price?", "expected_keywords": ["price match", "competitor"], "category": "Support Ticket"},
     ]
+    return tuple(
+        Query(
+            q["query"],
+            frozenset(kw.lower() for kw in q["expected_keywords"]),
+            Category(q["category"]),
+        )
+        for q in queries
+    )
+
+
+# ============================================================
+# FAQ LOOKUP
+# ============================================================
+
+# The inner keyword scan already runs in C: pyahocorasick when installed,
+# otherwise a single compiled `re` alternation. No custom extension needed.
+#
+# FAQ data and every index derived from it are built on first use by the
+# cached _faq_index() builder, so importing this module for policies or
+# product guides never pays for FAQ loading. The public names below are
+# served from that index by the module __getattr__ (PEP 562).
+class _FaqIndex(NamedTuple):
+    topics: Tuple[FaqRec, ...]        # FaqRec(question, answer, keywords)
+    questions: Tuple[str, ...]        # structure-of-arrays view of the questions
+    keywords: Tuple[FrozenSet[str], ...]  # lower-cased, interned keywords per FAQ
+    answer_buf: str                   # every answer in one buffer ...
+    answer_spans: Tuple[Tuple[int, int], ...]  # ... sliced by these spans
+    kw_to_faqs: Dict[str, Tuple[int, ...]]     # inverted index: keyword -> FAQ indices
+    automaton: object                 # Aho-Corasick automaton (None without pyahocorasick)
+    pattern: "re.Pattern"             # regex fallback ...
+    match_to_faqs: Dict[str, FrozenSet[int]]   # ... and its match -> FAQ indices map
+
+
+_FAQ_LAZY_NAMES = {
+    "FAQ_TOPICS": "topics",
+    "FAQ_QUESTIONS": "questions",
+    "FAQ_KEYWORDS": "keywords",
+}
+
+
+def _build_keyword_index(faq_keywords) -> dict:
+    """Build the inverted index from lower-cased keyword to FAQ indices."""
+    kw_to_faqs = {}
+    for i, keywords in enumerate(faq_keywords):
+        for kw in keywords:
+            kw_to_faqs.setdefault(kw, []).append(i)
+    return {kw: tuple(indices) for kw, indices in kw_to_faqs.items()}
+
+
+def _build_automaton(kw_to_indices: dict):
+    """Build an Aho-Corasick automaton whose hits yield index tuples."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw, indices in kw_to_indices.items():
+        automaton.add_word(kw, indices)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_keyword_pattern(kw_to_indices: dict):
+    """
+    Compile all keywords into one regex alternation.
+
+    Used when pyahocorasick is unavailable. Alternatives are ordered
+    longest-first inside a lookahead, so each position yields its longest
+    matching keyword; the returned map expands that match to every index
+    whose keyword is a prefix of it, giving the same overlapping hits as the
+    automaton.
+    """
+    ordered = sorted(kw_to_indices, key=len, reverse=True)
+    pattern = re.compile("(?=(" + "|".join(re.escape(kw) for kw in ordered) + "))")
+    match_to_indices = {
+        kw: frozenset(i for p, indices in kw_to_indices.items() if kw.startswith(p) for i in indices)
+        for kw in kw_to_indices
+    }
+    return pattern, match_to_indices
+
+
+def _match_keywords(text: str, automaton, pattern, match_to_indices) -> Tuple[int, ...]:
+    """Return sorted indices of every keyword occurring in already-normalized text."""
+    if automaton is not None:
+        return tuple(sorted({i for _, indices in automaton.iter(text) for i in indices}))
+    hits = set()
+    for match in pattern.finditer(text):
+        hits |= match_to_indices[match.group(1)]
+    return tuple(sorted(hits))
+
+
+@lru_cache(maxsize=None)
+def _faq_index() -> _FaqIndex:
+    """Load the FAQ topics and build their lookup structures once."""
+    topics = _load_faq_topics()
+    keywords = tuple(
+        frozenset(sys.intern(kw.lower()) for kw in faq.keywords) for faq in topics
+    )
+    offsets = list(itertools.accumulate((len(faq.answer) for faq in topics), initial=0))
+    kw_to_faqs = _build_keyword_index(keywords)
+    pattern, match_to_faqs = _build_keyword_pattern(kw_to_faqs)
+    return _FaqIndex(
+        topics=topics,
+        questions=tuple(faq.question for faq in topics),
+        keywords=keywords,
+        answer_buf="".join(faq.answer for faq in topics),
+        answer_spans=tuple(zip(offsets, offsets[1:])),
+        kw_to_faqs=kw_to_faqs,
+        automaton=_build_automaton(kw_to_faqs),
+        pattern=pattern,
+        match_to_faqs=match_to_faqs,
+    )
+
+
+def get_answer(index: int) -> str:
+    """Return the answer text for FAQ_TOPICS[index]."""
+    faqs = _faq_index()
+    start, end = faqs.answer_spans[index]
+    return faqs.answer_buf[start:end]
+
+
+def faqs_for_keyword(keyword: str) -> Tuple[int, ...]:
+    """Return indices of FAQs tagged with an exact keyword (case-insensitive)."""
+    return _faq_index().kw_to_faqs.get(keyword.lower(), ())
+
+
+def _normalize_query(query: str) -> str:
+    """Lower-case a query and collapse whitespace so equivalent phrasings share a cache entry."""
+    return " ".join(query.lower().split())
+
+
+@lru_cache(maxsize=1024)
+def resolve_faq(normalized_query: str) -> Tuple[int, ...]:
+    """Resolve an already-normalized query to matching FAQ indices (memoized)."""
+    faqs = _faq_index()
+    return _match_keywords(normalized_query, faqs.automaton, faqs.pattern, faqs.match_to_faqs)
+
+
+def find_faq(query: str) -> List[int]:
+    """Return indices into FAQ_TOPICS whose keywords appear in the query."""
+    return list(resolve_faq(_normalize_query(query)))
+
+
+def resolve_faq_batch(queries: List[str]) -> List[Tuple[int, ...]]:
+    """Resolve many queries in one call, sharing normalization and the resolver cache."""
+    return [resolve_faq(_normalize_query(q)) for q in queries]
+
+
+# ============================================================
+# POLICY LOOKUP
+# ============================================================
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _tokenize(text: str) -> List[str]:
+    """Split text into case-folded, interned word tokens."""
+    return [sys.intern(token) for token in _TOKEN_RE.findall(text.casefold())]
+
+
+def _build_policy_phrase_index() -> dict:
+    """Map each case-folded keyword phrase to the policies tagged with it."""
+    index = {}
+    for i, keywords in enumerate(POLICY_KEYWORDS):
+        for kw in keywords:
+            index.setdefault(kw.casefold(), []).append(i)
+    return {kw: tuple(indices) for kw, indices in index.items()}
+
+
+class _PolicyIndex(NamedTuple):
+    templates: Tuple[Policy, ...]
+    automaton: object                           # Aho-Corasick over phrases (or None)
+    pattern: "re.Pattern"                       # regex fallback ...
+    match_to_indices: Dict[str, FrozenSet[int]]  # ... and its match -> policy indices map
+
+
+_POLICY_LAZY_NAMES = {"POLICY_TEMPLATES": "templates"}
+
+
+@lru_cache(maxsize=None)
+def _policy_index() -> _PolicyIndex:
+    """Build POLICY_TEMPLATES and the policy lookup indexes once."""
+    phrases = _build_policy_phrase_index()
+    pattern, match_to_indices = _build_keyword_pattern(phrases)
+    return _PolicyIndex(
+        templates=tuple(get_policy(i) for i in range(len(POLICY_TITLES))),
+        automaton=_build_automaton(phrases),
+        pattern=pattern,
+        match_to_indices=match_to_indices,
+    )
+
+
+# BM25 parameters for policy and corpus search
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+
+def _term_freqs(docs: List[List[str]]) -> dict:
+    """Count tokens per doc: token -> {doc index: count}, doc indices ascending."""
+    term_freqs = {}
+    if np is None:
+        for i, doc in enumerate(docs):
+            for token in doc:
+                tf = term_freqs.setdefault(token, {})
+                tf[i] = tf.get(i, 0) + 1
+        return term_freqs
+
+    # Map tokens to dense int ids, then histogram each doc with np.unique
+    vocab = {}
+    tokens = []
+    for i, doc in enumerate(docs):
+        ids = np.fromiter(
+            (vocab.setdefault(token, len(vocab)) for token in doc),
+            dtype=np.int32,
+            count=len(doc),
+        )
+        if len(vocab) > len(tokens):
+            tokens.extend(itertools.islice(vocab, len(tokens), None))
+        unique, counts = np.unique(ids, return_counts=True)
+        for token_id, count in zip(unique.tolist(), counts.tolist()):
+            term_freqs.setdefault(tokens[token_id], {})[i] = count
+    return term_freqs
+
+
+def _bm25_postings(docs: List[List[str]]) -> dict:
+    """
+    Build BM25 postings over tokenized docs: token -> ((index, weight), ...).
+
+    The corpus is static, so each posting's full BM25 term weight is computed
+    once; scoring a query is then only a sum over its tokens' postings.
+    """
+    avg_len = sum(len(doc) for doc in docs) / len(docs)
+    term_freqs = _term_freqs(docs)
+
+    index = {}
+    n_docs = len(docs)
+    for token, tf in term_freqs.items():
+        idf = math.log(1 + (n_docs - len(tf) + 0.5) / (len(tf) + 0.5))
+        index[token] = tuple(
+            (i, idf * f * (BM25_K1 + 1)
+             / (f + BM25_K1 * (1 - BM25_B + BM25_B * len(docs[i]) / avg_len)))
+            for i, f in tf.items()
+        )
+    return index
+
+
+def _bm25_scores(index: dict, query: str) -> Dict[int, float]:
+    """Sum the precomputed weights of query tokens per doc index."""
+    scores = {}
+    for token in _tokenize(query):
+        for i, weight in index.get(token, ()):
+            scores[i] = scores.get(i, 0.0) + weight
+    return scores
+
+
+def _bm25_rank(index: dict, query: str, limit: int) -> List[int]:
+    """Return the indices of the top-scoring docs for query, best first."""
+    scores = _bm25_scores(index, query)
+    return sorted(scores, key=lambda i: (-scores[i], i))[:limit]
+
+
+@lru_cache(maxsize=None)
+def _policy_bm25_index() -> dict:
+    """BM25 postings over policy titles and bodies, indexed like POLICY_SLUGS."""
+    return _bm25_postings([
+        _tokenize(f"{POLICY_TITLES[i]} {get_policy_content(slug)}")
+        for i, slug in enumerate(POLICY_SLUGS)
+    ])
+
+
+def search_policies(query: str, limit: int = 3) -> List[Policy]:
+    """
+    Rank policies against a free-text query and return the best matches.
+
+    Policies whose keyword phrases occur in the query rank first. The phrases
+    are found in one pass by the automaton (or its regex fallback), so
+    "extended warranty" matches as a phrase, not as two tokens. BM25 over
+    titles and bodies orders each group and surfaces body-only matches.
+    """
+    policies = _policy_index()
+    hits = set(_match_keywords(
+        query.casefold(), policies.automaton, policies.pattern, policies.match_to_indices
+    ))
+    scores = _bm25_scores(_policy_bm25_index(), query)
+    ranked = sorted(hits | scores.keys(), key=lambda i: (i not in hits, -scores.get(i, 0.0), i))
+    return [policies.templates[i] for i in ranked[:limit]]
+
+
+@lru_cache(maxsize=1)
+def _corpus() -> Tuple[Document, ...]:
+    """The deduplicated corpus, generated once without printing a summary."""
+    return tuple(iter_all_documents())
+
+
+@lru_cache(maxsize=1)
+def _corpus_bm25_index() -> dict:
+    """BM25 postings over the titles and contents of _corpus()."""
+    return _bm25_postings([_tokenize(f"{doc.title} {doc.content}") for doc in _corpus()])
+
+
+def search_documents(query: str, limit: int = 5) -> List[Document]:
+    """Rank every generated document against a free-text query with BM25."""
+    docs = _corpus()
+    return [docs[i] for i in _bm25_rank(_corpus_bm25_index(), query, limit)]
+
+
+# ============================================================
+# CONTENT BLOB
+# ============================================================
+
+@lru_cache(maxsize=1)
+def _content_blob() -> Tuple[bytes, array]:
+    """
+    Pack the UTF-8 contents of _corpus() into one buffer.
+
+    Returns (blob, offsets) where document i occupies
+    blob[offsets[i]:offsets[i + 1]]. Substring scans then walk a single
+    contiguous buffer instead of one small object per document.
+    """
+    docs = _corpus()
+    offsets = array("q", itertools.accumulate((len(doc.content_utf8) for doc in docs), initial=0))
+    return b"".join(doc.content_utf8 for doc in docs), offsets
+
+
+def get_content_view(index: int) -> memoryview:
+    """Return a zero-copy view of document index's UTF-8 content in the blob."""
+    blob, offsets = _content_blob()
+    return memoryview(blob)[offsets[index]:offsets[index + 1]]
+
+
+def documents_containing(text: str) -> List[Document]:
+    """Return corpus documents whose content contains text (case-sensitive)."""
+    needle = text.encode("utf-8")
+    if not needle:
+        return list(_corpus())
+    blob, offsets = _content_blob()
+    docs = _corpus()
+    matches = []
+    pos = blob.find(needle)
+    while pos != -1:
+        i = bisect_right(offsets, pos) - 1
+        end = offsets[i + 1]
+        if pos + len(needle) <= end:
+            matches.append(docs[i])
+            pos = blob.find(needle, end)  # one hit per document is enough
+        else:
+            pos = blob.find(needle, pos + 1)  # straddled a document boundary
+    return matches
+
+
+# ============================================================
+# LAZY MODULE ATTRIBUTES
+# ============================================================
+
+def __getattr__(name: str):
+    if name in _FAQ_LAZY_NAMES:
+        return getattr(_faq_index(), _FAQ_LAZY_NAMES[name])
+    if name in _POLICY_LAZY_NAMES:
+        return getattr(_policy_index(), _POLICY_LAZY_NAMES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
@@ -1,18 +1,35 @@
 """Tests for /capture endpoint."""
-import pytest
+import json
 
+import pytest
 
-def test_capture_success(api_client, mock_memory, mock_capture):
-    """Test successful context capture."""
-    response = api_client.post(
-        "/capture",
-        json={
-            "summary": "Implementing auth feature",
-            "decisions": ["Use JWT tokens"],
-            "next_steps": ["Add refresh tokens"],
-            "tags": ["auth"],
-        },
-    )
+# Request bodies encoded once at import and posted as raw content
+JSON_HEADERS = {"content-type": "application/json"}
+FULL_CAPTURE = json.dumps({
+    "summary": "Implementing auth feature",
+    "decisions": ["Use JWT tokens"],
+    "next_steps": ["Add refresh tokens"],
+    "tags": ["auth"],
+}).encode()
+MINIMAL_CAPTURE = json.dumps({"summary": "Minimal capture"}).encode()
+EMPTY_CAPTURE = b"{}"
+BLOCKED_CAPTURE = json.dumps({
+    "summary": "Working on feature",
+    "blockers": ["Need API key", "Waiting for review"],
+}).encode()
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        pytest.param(FULL_CAPTURE, id="full"),
+        pytest.param(MINIMAL_CAPTURE, id="minimal"),
+        pytest.param(BLOCKED_CAPTURE, id="with-blockers"),
+    ],
+)
+def test_capture_success(api_client, mock_memory, mock_capture, body):
+    """Test successful context capture for full, minimal and blocked requests."""
+    response = api_client.post("/capture", content=body, headers=JSON_HEADERS)
 
     assert response.status_code == 200
     data = response.json()
@@ -21,32 +38,8 @@ def test_capture_success(api_client, mock_memory, mock_capture):
     assert data["stored_local"] is True
 
 
-def test_capture_minimal_request(api_client, mock_memory, mock_capture):
-    """Test capture with only required fields."""
-    response = api_client.post("/capture", json={"summary": "Minimal capture"})
-
-    assert response.status_code == 200
-    data = response.json()
-    assert data["success"] is True
-    assert "session_id" in data
-
-
 def test_capture_validation_error(api_client):
     """Test capture with missing required field."""
-    response = api_client.post("/capture", json={})
+    response = api_client.post("/capture", content=EMPTY_CAPTURE, headers=JSON_HEADERS)
 
     assert response.status_code == 422  # Validation error
-
-
-def test_capture_with_blockers(api_client, mock_memory, mock_capture):
-    """Test capture with blockers."""
-    response = api_client.post(
-        "/capture",
-        json={
-            "summary": "Working on feature",
-            "blockers": ["Need API key", "Waiting for review"],
-        },
-    )
-
-    assert response.status_code == 200
-    assert response.json()["success"] is True
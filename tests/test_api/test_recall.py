@@ -14,11 +14,11 @@ def test_recall_success(api_client, mock_backboard_client, mock_memory):
     assert len(data["results"]) > 0
 
 
-def test_recall_fallback_to_local(api_client, mock_memory, mock_config_no_backboard):
+def test_recall_fallback_to_local(
+    api_client, override_config, mock_memory, mock_config_no_backboard
+):
     """Test recall falls back to local when Backboard unavailable."""
-    from api.server import app
-
-    app.state.config = mock_config_no_backboard
+    override_config(mock_config_no_backboard)
 
     response = api_client.post("/recall", json={"query": "auth"})
 
@@ -35,11 +35,11 @@ def test_status_backboard_connected(api_client, mock_memory, mock_restore):
     assert data["team_configured"] is True
 
 
-def test_status_no_backboard(api_client, mock_config_no_backboard, mock_memory, mock_restore):
+def test_status_no_backboard(
+    api_client, override_config, mock_config_no_backboard, mock_memory, mock_restore
+):
     """Test status without Backboard configured."""
-    from api.server import app
-
-    app.state.config = mock_config_no_backboard
+    override_config(mock_config_no_backboard)
 
     response = api_client.get("/status")
 
@@ -13,11 +13,9 @@ def test_team_query_success(api_client, mock_backboard_client):
     assert data["team_configured"] is True
 
 
-def test_team_not_configured(api_client, mock_config_no_team):
+def test_team_not_configured(api_client, override_config, mock_config_no_team):
     """Test team query when team not configured."""
-    from api.server import app
-
-    app.state.config = mock_config_no_team
+    override_config(mock_config_no_team)
 
     response = api_client.post("/team", json={"query": "test"})
 
@@ -130,25 +130,24 @@ class TestBuildSession:
 
     def test_build_session_structure(self):
         """build_session should return complete session structure."""
-        with mock.patch.object(capture, 'capture_git_state') as mock_git, \
-             mock.patch.object(capture, 'analyze_context') as mock_analyze:
-
-            mock_git.return_value = {
-                "is_git": True,
-                "branch": "main",
-                "uncommitted_files": ["file.py"],
-                "recent_commits": ["abc123 Initial commit"],
-                "last_commit": {"hash": "abc123", "message": "Initial commit"}
-            }
-            mock_analyze.return_value = {
-                "summary": "Test session",
-                "hypothesis": "Test hypothesis",
-                "files": ["file.py"],
-                "next_steps": ["Step 1"],
-                "decisions": ["Decision 1"],
-                "learnings": ["Learning 1"]
-            }
+        git_state = {
+            "is_git": True,
+            "branch": "main",
+            "uncommitted_files": ["file.py"],
+            "recent_commits": ["abc123 Initial commit"],
+            "last_commit": {"hash": "abc123", "message": "Initial commit"}
+        }
+        context = {
+            "summary": "Test session",
+            "hypothesis": "Test hypothesis",
+            "files": ["file.py"],
+            "next_steps": ["Step 1"],
+            "decisions": ["Decision 1"],
+            "learnings": ["Learning 1"]
+        }
 
+        with mock.patch.object(capture, 'capture_git_state', return_value=git_state), \
+             mock.patch.object(capture, 'analyze_context', return_value=context):
             session = capture.build_session(
                 user_message="Test message",
                 tags=["test", "example"]
@@ -179,25 +178,24 @@ class TestBuildSession:
 
     def test_build_session_without_message(self):
         """build_session should work without user message."""
-        with mock.patch.object(capture, 'capture_git_state') as mock_git, \
-             mock.patch.object(capture, 'analyze_context') as mock_analyze:
-
-            mock_git.return_value = {
-                "is_git": True,
-                "branch": "main",
-                "uncommitted_files": [],
-                "recent_commits": [],
-                "last_commit": None
-            }
-            mock_analyze.return_value = {
-                "summary": "Working on code",
-                "hypothesis": None,
-                "files": [],
-                "next_steps": [],
-                "decisions": [],
-                "learnings": []
-            }
+        git_state = {
+            "is_git": True,
+            "branch": "main",
+            "uncommitted_files": [],
+            "recent_commits": [],
+            "last_commit": None
+        }
+        context = {
+            "summary": "Working on code",
+            "hypothesis": None,
+            "files": [],
+            "next_steps": [],
+            "decisions": [],
+            "learnings": []
+        }
 
+        with mock.patch.object(capture, 'capture_git_state', return_value=git_state), \
+             mock.patch.object(capture, 'analyze_context', return_value=context):
             session = capture.build_session()
 
             assert session["metadata"]["message"] is None
@@ -205,25 +203,24 @@ class TestBuildSession:
 
     def test_build_session_id_format(self):
         """build_session should generate correctly formatted session ID."""
-        with mock.patch.object(capture, 'capture_git_state') as mock_git, \
-             mock.patch.object(capture, 'analyze_context') as mock_analyze:
-
-            mock_git.return_value = {
-                "is_git": False,
-                "branch": None,
-                "uncommitted_files": [],
-                "recent_commits": [],
-                "last_commit": None
-            }
-            mock_analyze.return_value = {
-                "summary": "Test",
-                "hypothesis": None,
-                "files": [],
-                "next_steps": [],
-                "decisions": [],
-                "learnings": []
-            }
+        git_state = {
+            "is_git": False,
+            "branch": None,
+            "uncommitted_files": [],
+            "recent_commits": [],
+            "last_commit": None
+        }
+        context = {
+            "summary": "Test",
+            "hypothesis": None,
+            "files": [],
+            "next_steps": [],
+            "decisions": [],
+            "learnings": []
+        }
 
+        with mock.patch.object(capture, 'capture_git_state', return_value=git_state), \
+             mock.patch.object(capture, 'analyze_context', return_value=context):
             session = capture.build_session()
 
             # ID should be in format session_YYYY-MM-DD_HH-MM-SS
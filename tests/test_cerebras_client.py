@@ -6,6 +6,22 @@ import pytest
 
 import cerebras_client
 
+# Canned analyze_session_context responses, serialized once at import
+FULL_CONTEXT_JSON = json.dumps({
+    "summary": "Working on auth",
+    "hypothesis": "JWT is best",
+    "next_steps": ["Add tokens"],
+    "decisions": ["Use JWT"],
+    "learnings": ["JWT is fast"]
+})
+EMPTY_CONTEXT_JSON = json.dumps({
+    "summary": None,
+    "hypothesis": None,
+    "next_steps": [],
+    "decisions": [],
+    "learnings": []
+})
+
 
 class TestExceptions:
     """Tests for exception classes."""
@@ -45,102 +61,82 @@ class TestGetClient:
             mock_cerebras.assert_called_once_with(api_key="test-api-key")
 
 
+@pytest.fixture(scope="class")
+def cerebras_mock():
+    """Patch the Cerebras SDK once per test class; yield the shared client mock."""
+    mock_client = mock.MagicMock()
+
+    with mock.patch('cerebras_client.Cerebras', return_value=mock_client):
+        yield mock_client
+
+
 class TestComplete:
     """Tests for complete function."""
 
-    def test_complete_basic(self, monkeypatch):
-        """complete should return model response."""
+    @pytest.fixture
+    def cerebras(self, cerebras_mock, monkeypatch):
+        """Reset the shared client, give it a fresh response and set an API key for one test."""
         monkeypatch.setenv("CEREBRAS_API_KEY", "test-key")
 
         mock_response = mock.MagicMock()
-        mock_response.choices = [
-            mock.MagicMock(message=mock.MagicMock(content="Test response"))
-        ]
+        mock_response.choices = [mock.MagicMock(message=mock.MagicMock(content=""))]
+        cerebras_mock.reset_mock(return_value=True, side_effect=True)
+        cerebras_mock.chat.completions.create.return_value = mock_response
+        return cerebras_mock, mock_response
 
-        with mock.patch('cerebras_client.Cerebras') as mock_cerebras:
-            mock_client = mock.MagicMock()
-            mock_client.chat.completions.create.return_value = mock_response
-            mock_cerebras.return_value = mock_client
+    def test_complete_basic(self, cerebras):
+        """complete should return model response."""
+        _, mock_response = cerebras
+        mock_response.choices[0].message.content = "Test response"
 
-            result = cerebras_client.complete("Test prompt")
+        result = cerebras_client.complete("Test prompt")
 
-            assert result == "Test response"
+        assert result == "Test response"
 
-    def test_complete_with_system_message(self, monkeypatch):
+    def test_complete_with_system_message(self, cerebras):
         """complete should include system message when provided."""
-        monkeypatch.setenv("CEREBRAS_API_KEY", "test-key")
+        mock_client, _ = cerebras
 
-        mock_response = mock.MagicMock()
-        mock_response.choices = [
-            mock.MagicMock(message=mock.MagicMock(content="Response"))
-        ]
-
-        with mock.patch('cerebras_client.Cerebras') as mock_cerebras:
-            mock_client = mock.MagicMock()
-            mock_client.chat.completions.create.return_value = mock_response
-            mock_cerebras.return_value = mock_client
-
-            cerebras_client.complete("Prompt", system="System message")
+        cerebras_client.complete("Prompt", system="System message")
 
-            call_args = mock_client.chat.completions.create.call_args
-            messages = call_args.kwargs.get('messages', [])
-            assert any(m.get('role') == 'system' for m in messages)
+        call_args = mock_client.chat.completions.create.call_args
+        messages = call_args.kwargs.get('messages', [])
+        assert any(m.get('role') == 'system' for m in messages)
 
-    def test_complete_json_mode(self, monkeypatch):
+    def test_complete_json_mode(self, cerebras):
         """complete should set response_format for json_mode."""
-        monkeypatch.setenv("CEREBRAS_API_KEY", "test-key")
+        mock_client, mock_response = cerebras
+        mock_response.choices[0].message.content = '{"key": "value"}'
 
-        mock_response = mock.MagicMock()
-        mock_response.choices = [
-            mock.MagicMock(message=mock.MagicMock(content='{"key": "value"}'))
-        ]
+        cerebras_client.complete("Prompt", json_mode=True)
 
-        with mock.patch('cerebras_client.Cerebras') as mock_cerebras:
-            mock_client = mock.MagicMock()
-            mock_client.chat.completions.create.return_value = mock_response
-            mock_cerebras.return_value = mock_client
+        call_args = mock_client.chat.completions.create.call_args
+        response_format = call_args.kwargs.get('response_format')
+        assert response_format == {"type": "json_object"}
 
-            result = cerebras_client.complete("Prompt", json_mode=True)
-
-            call_args = mock_client.chat.completions.create.call_args
-            response_format = call_args.kwargs.get('response_format')
-            assert response_format == {"type": "json_object"}
-
-    def test_complete_handles_auth_error(self, monkeypatch):
+    def test_complete_handles_auth_error(self, cerebras):
         """complete should raise CerebrasAuthError on 401."""
-        monkeypatch.setenv("CEREBRAS_API_KEY", "invalid-key")
-
-        with mock.patch('cerebras_client.Cerebras') as mock_cerebras:
-            mock_client = mock.MagicMock()
-            mock_client.chat.completions.create.side_effect = Exception("401 Unauthorized")
-            mock_cerebras.return_value = mock_client
+        mock_client, _ = cerebras
+        mock_client.chat.completions.create.side_effect = Exception("401 Unauthorized")
 
-            with pytest.raises(cerebras_client.CerebrasAuthError):
-                cerebras_client.complete("Test prompt")
+        with pytest.raises(cerebras_client.CerebrasAuthError):
+            cerebras_client.complete("Test prompt")
 
-    def test_complete_handles_rate_limit(self, monkeypatch):
+    def test_complete_handles_rate_limit(self, cerebras):
         """complete should raise CerebrasRateLimitError on 429."""
-        monkeypatch.setenv("CEREBRAS_API_KEY", "test-key")
-
-        with mock.patch('cerebras_client.Cerebras') as mock_cerebras:
-            mock_client = mock.MagicMock()
-            mock_client.chat.completions.create.side_effect = Exception("429 rate limit exceeded")
-            mock_cerebras.return_value = mock_client
+        mock_client, _ = cerebras
+        mock_client.chat.completions.create.side_effect = Exception("429 rate limit exceeded")
 
-            with pytest.raises(cerebras_client.CerebrasRateLimitError):
-                cerebras_client.complete("Test prompt")
+        with pytest.raises(cerebras_client.CerebrasRateLimitError):
+            cerebras_client.complete("Test prompt")
 
-    def test_complete_handles_generic_error(self, monkeypatch):
+    def test_complete_handles_generic_error(self, cerebras):
         """complete should raise CerebrasError on other errors."""
-        monkeypatch.setenv("CEREBRAS_API_KEY", "test-key")
-
-        with mock.patch('cerebras_client.Cerebras') as mock_cerebras:
-            mock_client = mock.MagicMock()
-            mock_client.chat.completions.create.side_effect = Exception("Server error")
-            mock_cerebras.return_value = mock_client
+        mock_client, _ = cerebras
+        mock_client.chat.completions.create.side_effect = Exception("Server error")
 
-            with pytest.raises(cerebras_client.CerebrasError):
-                cerebras_client.complete("Test prompt")
+        with pytest.raises(cerebras_client.CerebrasError):
+            cerebras_client.complete("Test prompt")
 
 
 class TestAnalyzeSessionContext:
@@ -149,66 +145,64 @@ class TestAnalyzeSessionContext:
     def test_analyze_session_context_success(self, monkeypatch):
         """analyze_session_context should return structured context."""
         monkeypatch.setenv("CEREBRAS_API_KEY", "test-key")
+        monkeypatch.setattr(cerebras_client, 'complete', mock.Mock(return_value=FULL_CONTEXT_JSON))
+
+        result = cerebras_client.analyze_session_context(
+            branch="feature/auth",
+            files=["auth.py"],
+            diff_summary="Added authentication",
+            user_message="Working on login"
+        )
 
-        mock_json_response = json.dumps({
-            "summary": "Working on auth",
-            "hypothesis": "JWT is best",
-            "next_steps": ["Add tokens"],
-            "decisions": ["Use JWT"],
-            "learnings": ["JWT is fast"]
-        })
-
-        with mock.patch.object(cerebras_client, 'complete', return_value=mock_json_response):
-            result = cerebras_client.analyze_session_context(
-                branch="feature/auth",
-                files=["auth.py"],
-                diff_summary="Added authentication",
-                user_message="Working on login"
-            )
-
-            assert result["summary"] == "Working on auth"
-            assert result["hypothesis"] == "JWT is best"
-            assert result["next_steps"] == ["Add tokens"]
-            assert result["decisions"] == ["Use JWT"]
-            assert result["learnings"] == ["JWT is fast"]
+        assert result["summary"] == "Working on auth"
+        assert result["hypothesis"] == "JWT is best"
+        assert result["next_steps"] == ["Add tokens"]
+        assert result["decisions"] == ["Use JWT"]
+        assert result["learnings"] == ["JWT is fast"]
 
     def test_analyze_session_context_handles_invalid_json(self, monkeypatch):
         """analyze_session_context should handle invalid JSON gracefully."""
         monkeypatch.setenv("CEREBRAS_API_KEY", "test-key")
+        monkeypatch.setattr(cerebras_client, 'complete', mock.Mock(return_value="not valid json"))
+
+        result = cerebras_client.analyze_session_context(
+            branch="main",
+            files=[],
+            diff_summary="",
+            user_message="Test message"
+        )
+
+        # Should return fallback
+        assert result["summary"] == "Test message"
+        assert result["hypothesis"] is None
+        assert result["next_steps"] == []
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_analyze_session_context_invalid_json_with_either_parser(self, monkeypatch, use_orjson):
+        """Invalid JSON should fall back whether orjson or json parses it."""
+        monkeypatch.setenv("CEREBRAS_API_KEY", "test-key")
+        if not use_orjson:
+            monkeypatch.setattr(cerebras_client, "orjson", None)
+        monkeypatch.setattr(cerebras_client, 'complete', mock.Mock(return_value='{"summary": '))
 
-        with mock.patch.object(cerebras_client, 'complete', return_value="not valid json"):
-            result = cerebras_client.analyze_session_context(
-                branch="main",
-                files=[],
-                diff_summary="",
-                user_message="Test message"
-            )
+        result = cerebras_client.analyze_session_context(
+            branch="main", files=[], diff_summary="", user_message="Fallback"
+        )
 
-            # Should return fallback
-            assert result["summary"] == "Test message"
-            assert result["hypothesis"] is None
-            assert result["next_steps"] == []
+        assert result["summary"] == "Fallback"
 
     def test_analyze_session_context_default_summary(self, monkeypatch):
         """analyze_session_context should provide default summary."""
         monkeypatch.setenv("CEREBRAS_API_KEY", "test-key")
+        monkeypatch.setattr(cerebras_client, 'complete', mock.Mock(return_value=EMPTY_CONTEXT_JSON))
 
-        mock_json_response = json.dumps({
-            "summary": None,
-            "hypothesis": None,
-            "next_steps": [],
-            "decisions": [],
-            "learnings": []
-        })
-
-        with mock.patch.object(cerebras_client, 'complete', return_value=mock_json_response):
-            result = cerebras_client.analyze_session_context(
-                branch="main",
-                files=[],
-                diff_summary=""
-            )
+        result = cerebras_client.analyze_session_context(
+            branch="main",
+            files=[],
+            diff_summary=""
+        )
 
-            assert result["summary"] == "Working on code changes"
+        assert result["summary"] == "Working on code changes"
 
 
 class TestGenerateRestorationMessage:
@@ -220,47 +214,48 @@ class TestGenerateRestorationMessage:
 
         expected_message = "Welcome back! You were working on auth feature."
 
-        with mock.patch.object(cerebras_client, 'complete', return_value=expected_message):
-            result = cerebras_client.generate_restoration_message(
-                context={
-                    "summary": "Working on auth",
-                    "hypothesis": "JWT approach",
-                    "files": ["auth.py"],
-                    "branch": "feature",
-                    "learnings": []
-                },
-                changes={
-                    "elapsed": "2h",
-                    "commits": [],
-                    "files_changed": []
-                }
-            )
-
-            assert result == expected_message
+        monkeypatch.setattr(cerebras_client, 'complete', mock.Mock(return_value=expected_message))
+
+        result = cerebras_client.generate_restoration_message(
+            context={
+                "summary": "Working on auth",
+                "hypothesis": "JWT approach",
+                "files": ["auth.py"],
+                "branch": "feature",
+                "learnings": []
+            },
+            changes={
+                "elapsed": "2h",
+                "commits": [],
+                "files_changed": []
+            }
+        )
+
+        assert result == expected_message
 
     def test_generate_restoration_message_fallback(self, monkeypatch):
         """generate_restoration_message should fallback on error."""
         monkeypatch.setenv("CEREBRAS_API_KEY", "test-key")
-
-        with mock.patch.object(
+        monkeypatch.setattr(
             cerebras_client, 'complete',
-            side_effect=cerebras_client.CerebrasError("API down")
-        ):
-            result = cerebras_client.generate_restoration_message(
-                context={
-                    "summary": "Working on feature",
-                    "hypothesis": None,
-                    "files": [],
-                    "branch": "main",
-                    "learnings": []
-                },
-                changes={
-                    "elapsed": "3h",
-                    "commits": [],
-                    "files_changed": []
-                }
-            )
-
-            assert "Welcome back" in result
-            assert "Working on feature" in result
-            assert "3h" in result
+            mock.Mock(side_effect=cerebras_client.CerebrasError("API down"))
+        )
+
+        result = cerebras_client.generate_restoration_message(
+            context={
+                "summary": "Working on feature",
+                "hypothesis": None,
+                "files": [],
+                "branch": "main",
+                "learnings": []
+            },
+            changes={
+                "elapsed": "3h",
+                "commits": [],
+                "files_changed": []
+            }
+        )
+
+        assert "Welcome back" in result
+        assert "Working on feature" in result
+        assert "3h" in result
@@ -2,10 +2,12 @@
 import asyncio
 import json
 import os
+import shutil
 import signal
 import tempfile
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
 from unittest import mock
 
 import pytest
@@ -13,128 +15,182 @@ import pytest
 import daemon
 
 
+@pytest.fixture(scope="class")
+def daemon_paths(tmp_path_factory):
+    """Point the daemon's state files at one temp directory per test class."""
+    state_dir = tmp_path_factory.mktemp("daemon") / "state"
+    paths = SimpleNamespace(
+        state_dir=state_dir,
+        log=state_dir / "daemon.log",
+        state=state_dir / "state.json",
+        pid=state_dir / "daemon.pid",
+    )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(daemon, 'DAEMON_STATE_DIR', paths.state_dir)
+        mp.setattr(daemon, 'LOG_FILE', paths.log)
+        mp.setattr(daemon, 'STATE_FILE', paths.state)
+        mp.setattr(daemon, 'PID_FILE', paths.pid)
+        yield paths
+
+
+@pytest.fixture
+def daemon_files(daemon_paths):
+    """Shared daemon paths with an empty state dir, removed with its contents afterwards."""
+    daemon_paths.state_dir.mkdir(exist_ok=True)
+    yield daemon_paths
+    shutil.rmtree(daemon_paths.state_dir, ignore_errors=True)
+
+
 class TestLogging:
     """Tests for log function."""
 
-    def test_log_creates_directory(self, tmp_path, monkeypatch):
+    def test_log_creates_directory(self, daemon_files):
         """Should create daemon state directory if it doesn't exist."""
-        log_dir = tmp_path / "daemon"
-        monkeypatch.setattr(daemon, 'DAEMON_STATE_DIR', log_dir)
-        monkeypatch.setattr(daemon, 'LOG_FILE', log_dir / "daemon.log")
+        daemon_files.state_dir.rmdir()
 
         daemon.log("Test message")
 
-        assert log_dir.exists()
-        assert (log_dir / "daemon.log").exists()
+        assert daemon_files.state_dir.exists()
+        assert daemon_files.log.exists()
 
-    def test_log_writes_timestamp(self, tmp_path, monkeypatch):
+    def test_log_writes_timestamp(self, daemon_files):
         """Should write log with timestamp."""
-        log_dir = tmp_path / "daemon"
-        log_file = log_dir / "daemon.log"
-        monkeypatch.setattr(daemon, 'DAEMON_STATE_DIR', log_dir)
-        monkeypatch.setattr(daemon, 'LOG_FILE', log_file)
-
         daemon.log("Test message")
 
-        content = log_file.read_text()
+        content = daemon_files.log.read_text()
         # Should have timestamp format [YYYY-MM-DD HH:MM:SS]
         assert "[" in content
         assert "]" in content
         assert "Test message" in content
+        datetime.strptime(content[1:20], "%Y-%m-%d %H:%M:%S")
 
 
 class TestStateManagement:
     """Tests for load_state and save_state functions."""
 
-    def test_load_state_returns_default_when_no_file(self, tmp_path, monkeypatch):
+    def test_load_state_returns_default_when_no_file(self, daemon_files):
         """Should return default state when state file doesn't exist."""
-        monkeypatch.setattr(daemon, 'STATE_FILE', tmp_path / "nonexistent.json")
-
         result = daemon.load_state()
 
         assert result["sessions"] == {}
         assert result["started_at"] is None
         assert result["extractions_count"] == 0
 
-    def test_load_state_reads_existing_file(self, tmp_path, monkeypatch):
+    def test_load_state_reads_existing_file(self, daemon_files):
         """Should read existing state file."""
-        state_file = tmp_path / "state.json"
         state_data = {
             "sessions": {"sess1": {"last_line": 10}},
             "started_at": "2024-01-01T00:00:00",
             "extractions_count": 5
         }
-        state_file.write_text(json.dumps(state_data))
-        monkeypatch.setattr(daemon, 'STATE_FILE', state_file)
+        daemon_files.state.write_text(json.dumps(state_data))
 
         result = daemon.load_state()
 
         assert result["sessions"] == {"sess1": {"last_line": 10}}
         assert result["extractions_count"] == 5
 
-    def test_save_state_creates_directory(self, tmp_path, monkeypatch):
+    def test_save_state_creates_directory(self, daemon_files):
         """Should create state directory if it doesn't exist."""
-        state_dir = tmp_path / "daemon"
-        state_file = state_dir / "state.json"
-        monkeypatch.setattr(daemon, 'DAEMON_STATE_DIR', state_dir)
-        monkeypatch.setattr(daemon, 'STATE_FILE', state_file)
+        daemon_files.state_dir.rmdir()
 
         daemon.save_state({"sessions": {}, "extractions_count": 0})
 
-        assert state_dir.exists()
-        assert state_file.exists()
+        assert daemon_files.state_dir.exists()
+        assert daemon_files.state.exists()
 
-    def test_save_state_writes_json(self, tmp_path, monkeypatch):
+    def test_save_state_writes_json(self, daemon_files):
         """Should write valid JSON to state file."""
-        state_dir = tmp_path / "daemon"
-        state_file = state_dir / "state.json"
-        monkeypatch.setattr(daemon, 'DAEMON_STATE_DIR', state_dir)
-        monkeypatch.setattr(daemon, 'STATE_FILE', state_file)
-
         state_data = {"sessions": {"s1": {"last_line": 5}}, "extractions_count": 3}
         daemon.save_state(state_data)
 
-        content = json.loads(state_file.read_text())
+        content = json.loads(daemon_files.state.read_text())
         assert content["extractions_count"] == 3
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_state_roundtrip_with_either_encoder(self, daemon_files, monkeypatch, use_orjson):
+        """State should survive save/load whether orjson or json handles it."""
+        if not use_orjson:
+            monkeypatch.setattr(daemon, "orjson", None)
+        state_data = {
+            "sessions": {"s1": {"last_line": 5}},
+            "started_at": datetime(2024, 1, 1),
+            "counts": {1: 2},
+        }
+
+        daemon.save_state(state_data)
+        result = daemon.load_state()
+
+        assert result["sessions"] == {"s1": {"last_line": 5}}
+        assert result["started_at"] == "2024-01-01 00:00:00"
+        assert result["counts"] == {"1": 2}
+
+    def test_load_state_returns_default_for_corrupt_file(self, daemon_files):
+        """Should fall back to default state when the file is not valid JSON."""
+        daemon_files.state.write_text('{"sessions": ')
+
+        result = daemon.load_state()
+
+        assert result["sessions"] == {}
+
 
 class TestExtractJsonFromResponse:
     """Tests for _extract_json_from_response function."""
 
-    def test_extracts_direct_json_array(self):
-        """Should parse direct JSON array."""
-        response = '[{"category": "learning", "insight": "test"}]'
-        result = daemon._extract_json_from_response(response)
-        assert len(result) == 1
-        assert result[0]["insight"] == "test"
-
-    def test_extracts_from_markdown_code_block(self):
-        """Should extract JSON from markdown code block."""
-        response = '''Here's the analysis:
+    @pytest.mark.parametrize(
+        "response,expected",
+        [
+            pytest.param(
+                '[{"category": "learning", "insight": "test"}]',
+                ["test"],
+                id="direct-array",
+            ),
+            pytest.param(
+                '''Here's the analysis:
 ```json
 [{"category": "decision", "insight": "use JWT"}]
 ```
-That's all.'''
+That's all.''',
+                ["use JWT"],
+                id="markdown-code-block",
+            ),
+            pytest.param(
+                'The insights are: [{"category": "context", "insight": "working on auth"}] end.',
+                ["working on auth"],
+                id="mixed-text",
+            ),
+            pytest.param("No valid JSON here", [], id="invalid-json"),
+        ],
+    )
+    def test_extracts_insights(self, response, expected):
+        """Should parse the JSON array wherever the model put it, else return []."""
         result = daemon._extract_json_from_response(response)
-        assert len(result) == 1
-        assert result[0]["insight"] == "use JWT"
+        assert [item["insight"] for item in result] == expected
 
-    def test_extracts_array_from_mixed_text(self):
-        """Should find JSON array in mixed text."""
-        response = 'The insights are: [{"category": "context", "insight": "working on auth"}] end.'
-        result = daemon._extract_json_from_response(response)
-        assert len(result) == 1
 
-    def test_returns_empty_for_invalid_json(self):
-        """Should return empty list for invalid JSON."""
-        response = 'No valid JSON here'
-        result = daemon._extract_json_from_response(response)
-        assert result == []
+@pytest.fixture(scope="class")
+def shared_complete():
+    """Patch cerebras_client.complete with one MagicMock per test class."""
+    with mock.patch.object(daemon.cerebras_client, 'complete') as complete:
+        yield complete
+
+
+@pytest.fixture(scope="class")
+def shared_store():
+    """Patch backboard_client.store_message with one AsyncMock per test class."""
+    with mock.patch.object(daemon.backboard_client, 'store_message', new_callable=mock.AsyncMock) as store:
+        yield store
 
 
 class TestExtractInsights:
     """Tests for extract_insights function."""
 
+    @pytest.fixture(autouse=True)
+    def mock_complete(self, shared_complete):
+        """Hand each test the shared complete mock, reset afterwards."""
+        yield shared_complete
+        shared_complete.reset_mock(return_value=True, side_effect=True)
+
     @pytest.mark.asyncio
     async def test_returns_empty_for_empty_input(self):
         """Should return empty list for empty input."""
@@ -148,10 +204,9 @@ class TestExtractInsights:
         assert result == []
 
     @pytest.mark.asyncio
-    async def test_calls_cerebras_and_parses_response(self, monkeypatch):
+    async def test_calls_cerebras_and_parses_response(self, mock_complete):
         """Should call Cerebras and parse response."""
-        mock_complete = mock.MagicMock(return_value='[{"category": "learning", "insight": "test insight"}]')
-        monkeypatch.setattr(daemon.cerebras_client, 'complete', mock_complete)
+        mock_complete.return_value = '[{"category": "learning", "insight": "test insight"}]'
 
         result = await daemon.extract_insights("Human: How do I test?\nAssistant: Use pytest.")
 
@@ -161,21 +216,29 @@ class TestExtractInsights:
         mock_complete.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_handles_cerebras_error(self, monkeypatch, tmp_path):
+    async def test_prompt_matches_template(self, mock_complete):
+        """The prebuilt prompt should equal the formatted EXTRACTION_PROMPT."""
+        mock_complete.return_value = "[]"
+        conversation = "Human: What does {x} do?\nAssistant: It's a placeholder."
+
+        await daemon.extract_insights(conversation)
+
+        prompt = mock_complete.call_args.kwargs["prompt"]
+        assert prompt == daemon.EXTRACTION_PROMPT.format(conversation=conversation)
+
+    @pytest.mark.asyncio
+    async def test_handles_cerebras_error(self, mock_complete, daemon_files):
         """Should handle Cerebras errors gracefully."""
-        monkeypatch.setattr(daemon, 'DAEMON_STATE_DIR', tmp_path)
-        monkeypatch.setattr(daemon, 'LOG_FILE', tmp_path / "daemon.log")
-        monkeypatch.setattr(daemon.cerebras_client, 'complete', mock.MagicMock(side_effect=Exception("API Error")))
+        mock_complete.side_effect = Exception("API Error")
 
         result = await daemon.extract_insights("Some conversation")
 
         assert result == []
 
     @pytest.mark.asyncio
-    async def test_validates_insights_have_required_fields(self, monkeypatch):
+    async def test_validates_insights_have_required_fields(self, mock_complete):
         """Should filter out insights without required fields."""
-        mock_complete = mock.MagicMock(return_value='[{"category": "learning"}, {"insight": "valid"}]')
-        monkeypatch.setattr(daemon.cerebras_client, 'complete', mock_complete)
+        mock_complete.return_value = '[{"category": "learning"}, {"insight": "valid"}]'
 
         result = await daemon.extract_insights("Some conversation")
 
@@ -187,15 +250,16 @@ class TestExtractInsights:
 class TestStoreInsights:
     """Tests for store_insights function."""
 
+    @pytest.fixture(autouse=True)
+    def mock_store(self, shared_store, daemon_files):
+        """Hand each test the shared store mock, reset afterwards."""
+        yield shared_store
+        shared_store.reset_mock(side_effect=True)
+
     @pytest.mark.asyncio
-    async def test_skips_when_no_thread_id(self, monkeypatch, tmp_path):
+    async def test_skips_when_no_thread_id(self, monkeypatch, mock_store):
         """Should skip storage when BACKBOARD_PERSONAL_THREAD_ID is not set."""
         monkeypatch.delenv("BACKBOARD_PERSONAL_THREAD_ID", raising=False)
-        monkeypatch.setattr(daemon, 'DAEMON_STATE_DIR', tmp_path)
-        monkeypatch.setattr(daemon, 'LOG_FILE', tmp_path / "daemon.log")
-
-        mock_store = mock.AsyncMock()
-        monkeypatch.setattr(daemon.backboard_client, 'store_message', mock_store)
 
         insights = [{"category": "learning", "insight": "test"}]
         await daemon.store_insights(insights, "session1", "/test")
@@ -203,14 +267,9 @@ class TestStoreInsights:
         mock_store.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_stores_each_insight(self, monkeypatch, tmp_path):
+    async def test_stores_each_insight(self, monkeypatch, mock_store):
         """Should store each insight to Backboard."""
         monkeypatch.setenv("BACKBOARD_PERSONAL_THREAD_ID", "thread123")
-        monkeypatch.setattr(daemon, 'DAEMON_STATE_DIR', tmp_path)
-        monkeypatch.setattr(daemon, 'LOG_FILE', tmp_path / "daemon.log")
-
-        mock_store = mock.AsyncMock()
-        monkeypatch.setattr(daemon.backboard_client, 'store_message', mock_store)
 
         insights = [
             {"category": "learning", "insight": "First insight"},
@@ -221,14 +280,9 @@ class TestStoreInsights:
         assert mock_store.call_count == 2
 
     @pytest.mark.asyncio
-    async def test_skips_empty_insights(self, monkeypatch, tmp_path):
+    async def test_skips_empty_insights(self, monkeypatch, mock_store):
         """Should skip insights with empty text."""
         monkeypatch.setenv("BACKBOARD_PERSONAL_THREAD_ID", "thread123")
-        monkeypatch.setattr(daemon, 'DAEMON_STATE_DIR', tmp_path)
-        monkeypatch.setattr(daemon, 'LOG_FILE', tmp_path / "daemon.log")
-
-        mock_store = mock.AsyncMock()
-        monkeypatch.setattr(daemon.backboard_client, 'store_message', mock_store)
 
         insights = [
             {"category": "learning", "insight": ""},
@@ -239,150 +293,162 @@ class TestStoreInsights:
         assert mock_store.call_count == 1
 
     @pytest.mark.asyncio
-    async def test_handles_backboard_error(self, monkeypatch, tmp_path):
+    async def test_handles_backboard_error(self, monkeypatch, mock_store):
         """Should handle Backboard errors gracefully."""
         monkeypatch.setenv("BACKBOARD_PERSONAL_THREAD_ID", "thread123")
-        monkeypatch.setattr(daemon, 'DAEMON_STATE_DIR', tmp_path)
-        monkeypatch.setattr(daemon, 'LOG_FILE', tmp_path / "daemon.log")
-
-        mock_store = mock.AsyncMock(side_effect=daemon.BackboardError("Connection failed"))
-        monkeypatch.setattr(daemon.backboard_client, 'store_message', mock_store)
+        mock_store.side_effect = daemon.BackboardError("Connection failed")
 
         insights = [{"category": "learning", "insight": "test"}]
         # Should not raise
         await daemon.store_insights(insights, "session1", "/test")
 
+    @pytest.mark.asyncio
+    async def test_stores_remaining_insights_after_error(self, monkeypatch, mock_store):
+        """A failed store should not prevent the other insights from being sent."""
+        monkeypatch.setenv("BACKBOARD_PERSONAL_THREAD_ID", "thread123")
+        mock_store.side_effect = [daemon.BackboardError("Connection failed"), None]
+
+        insights = [
+            {"category": "learning", "insight": "First insight"},
+            {"category": "decision", "insight": "Second insight"},
+        ]
+        await daemon.store_insights(insights, "session1", "/test")
+
+        assert mock_store.call_count == 2
+        assert "Stored decision: Second insight" in daemon.LOG_FILE.read_text()
+
+    @pytest.mark.asyncio
+    async def test_logs_all_results_before_unexpected_error(self, monkeypatch, mock_store):
+        """An unexpected error is re-raised only after every outcome is logged."""
+        monkeypatch.setenv("BACKBOARD_PERSONAL_THREAD_ID", "thread123")
+        mock_store.side_effect = [RuntimeError("boom"), None]
+
+        insights = [
+            {"category": "learning", "insight": "First insight"},
+            {"category": "decision", "insight": "Second insight"},
+        ]
+        with pytest.raises(RuntimeError, match="boom"):
+            await daemon.store_insights(insights, "session1", "/test")
+
+        content = daemon.LOG_FILE.read_text()
+        assert "Failed to store insight: boom" in content
+        assert "Stored decision: Second insight" in content
+
 
 class TestIsRunning:
     """Tests for is_running function."""
 
-    def test_returns_none_when_no_pid_file(self, tmp_path, monkeypatch):
+    def test_returns_none_when_no_pid_file(self, daemon_files):
         """Should return None when PID file doesn't exist."""
-        monkeypatch.setattr(daemon, 'PID_FILE', tmp_path / "nonexistent.pid")
-
         result = daemon.is_running()
 
         assert result is None
 
-    def test_returns_none_for_invalid_pid(self, tmp_path, monkeypatch):
+    def test_returns_none_for_invalid_pid(self, daemon_files):
         """Should return None when PID file contains invalid data."""
-        pid_file = tmp_path / "daemon.pid"
-        pid_file.write_text("not a number")
-        monkeypatch.setattr(daemon, 'PID_FILE', pid_file)
+        daemon_files.pid.write_text("not a number")
 
         result = daemon.is_running()
 
         assert result is None
-        assert not pid_file.exists()  # Should clean up invalid PID file
+        assert not daemon_files.pid.exists()  # Should clean up invalid PID file
 
-    def test_returns_pid_when_process_exists(self, tmp_path, monkeypatch):
+    def test_returns_pid_when_process_exists(self, daemon_files):
         """Should return PID when process is running."""
-        pid_file = tmp_path / "daemon.pid"
         current_pid = os.getpid()  # Use our own PID (guaranteed to exist)
-        pid_file.write_text(str(current_pid))
-        monkeypatch.setattr(daemon, 'PID_FILE', pid_file)
+        daemon_files.pid.write_text(str(current_pid))
 
         result = daemon.is_running()
 
         assert result == current_pid
 
+    def test_returns_none_for_dead_pid(self, daemon_files):
+        """Should return None and clean up when no process has the PID."""
+        daemon_files.pid.write_text(str(2 ** 22 + 1))  # Above Linux pid_max
+
+        result = daemon.is_running()
+
+        assert result is None
+        assert not daemon_files.pid.exists()
+
 
 class TestDaemonStatus:
     """Tests for daemon_status function."""
 
-    def test_returns_not_running_status(self, tmp_path, monkeypatch):
+    def test_returns_not_running_status(self, daemon_files):
         """Should return not running status when daemon is not running."""
-        monkeypatch.setattr(daemon, 'PID_FILE', tmp_path / "nonexistent.pid")
-        monkeypatch.setattr(daemon, 'STATE_FILE', tmp_path / "state.json")
-        monkeypatch.setattr(daemon, 'LOG_FILE', tmp_path / "daemon.log")
-
         status = daemon.daemon_status()
 
         assert status["running"] is False
         assert status["pid"] is None
 
-    def test_returns_running_status(self, tmp_path, monkeypatch):
+    def test_returns_running_status(self, daemon_files):
         """Should return running status when daemon is running."""
-        pid_file = tmp_path / "daemon.pid"
-        pid_file.write_text(str(os.getpid()))
-        monkeypatch.setattr(daemon, 'PID_FILE', pid_file)
-        monkeypatch.setattr(daemon, 'STATE_FILE', tmp_path / "state.json")
-        monkeypatch.setattr(daemon, 'LOG_FILE', tmp_path / "daemon.log")
+        daemon_files.pid.write_text(str(os.getpid()))
 
         status = daemon.daemon_status()
 
         assert status["running"] is True
         assert status["pid"] == os.getpid()
 
-    def test_includes_state_info(self, tmp_path, monkeypatch):
+    def test_includes_state_info(self, daemon_files):
         """Should include state information."""
-        state_file = tmp_path / "state.json"
-        state_file.write_text(json.dumps({
+        daemon_files.state.write_text(json.dumps({
             "sessions": {"s1": {}, "s2": {}},
             "started_at": "2024-01-01T00:00:00",
             "extractions_count": 10
         }))
-        monkeypatch.setattr(daemon, 'PID_FILE', tmp_path / "nonexistent.pid")
-        monkeypatch.setattr(daemon, 'STATE_FILE', state_file)
-        monkeypatch.setattr(daemon, 'LOG_FILE', tmp_path / "daemon.log")
 
         status = daemon.daemon_status()
 
         assert status["extractions_count"] == 10
         assert status["sessions_tracked"] == 2
 
-    def test_includes_recent_logs(self, tmp_path, monkeypatch):
+    def test_includes_recent_logs(self, daemon_files):
         """Should include recent log lines."""
-        log_file = tmp_path / "daemon.log"
-        log_file.write_text("Line 1\nLine 2\nLine 3\nLine 4\nLine 5\nLine 6\n")
-        monkeypatch.setattr(daemon, 'PID_FILE', tmp_path / "nonexistent.pid")
-        monkeypatch.setattr(daemon, 'STATE_FILE', tmp_path / "state.json")
-        monkeypatch.setattr(daemon, 'LOG_FILE', log_file)
+        daemon_files.log.write_text("Line 1\nLine 2\nLine 3\nLine 4\nLine 5\nLine 6\n")
 
         status = daemon.daemon_status()
 
         assert "recent_logs" in status
         assert len(status["recent_logs"]) == 5
 
+    def test_recent_logs_from_large_log(self, daemon_files):
+        """Should return the last five lines of a log spanning many read blocks."""
+        daemon_files.log.write_text("".join(f"Line {i}\n" for i in range(2000)))
+
+        status = daemon.daemon_status()
+
+        assert status["recent_logs"] == [f"Line {i}" for i in range(1995, 2000)]
+
 
 class TestProcessSession:
     """Tests for process_session function."""
 
+    # session_parser is mocked in every test, so the file is never opened
+    SESSION_FILE = Path("/nonexistent/test.jsonl")
+
     @pytest.mark.asyncio
-    async def test_returns_false_when_no_new_messages(self, tmp_path, monkeypatch):
+    async def test_returns_false_when_no_new_messages(self, daemon_files, monkeypatch):
         """Should return False when there are no new messages."""
-        monkeypatch.setattr(daemon, 'DAEMON_STATE_DIR', tmp_path)
-        monkeypatch.setattr(daemon, 'STATE_FILE', tmp_path / "state.json")
-        monkeypatch.setattr(daemon, 'LOG_FILE', tmp_path / "daemon.log")
-
-        session_file = tmp_path / "test.jsonl"
-        session_file.write_text("")
-
-        mock_get_conv = mock.MagicMock(return_value=("", 0))
-        monkeypatch.setattr(daemon.session_parser, 'get_conversation_text', mock_get_conv)
+        mock_read_conv = mock.MagicMock(return_value=("", 0, 0))
+        monkeypatch.setattr(daemon.session_parser, 'read_conversation', mock_read_conv)
 
         state = {"sessions": {"test": {"last_line": 0}}}
-        result = await daemon.process_session(session_file, state)
+        result = await daemon.process_session(self.SESSION_FILE, state)
 
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_extracts_when_batch_threshold_met(self, tmp_path, monkeypatch):
+    async def test_extracts_when_batch_threshold_met(self, daemon_files, monkeypatch):
         """Should extract insights when batch threshold is met."""
-        monkeypatch.setattr(daemon, 'DAEMON_STATE_DIR', tmp_path)
-        monkeypatch.setattr(daemon, 'STATE_FILE', tmp_path / "state.json")
-        monkeypatch.setattr(daemon, 'LOG_FILE', tmp_path / "daemon.log")
         monkeypatch.setattr(daemon, 'MIN_MESSAGES_BATCH', 2)
         monkeypatch.delenv("BACKBOARD_PERSONAL_THREAD_ID", raising=False)
 
-        session_file = tmp_path / "test.jsonl"
-        session_file.write_text("")
-
-        # Simulate having new messages
-        mock_get_conv = mock.MagicMock(side_effect=[
-            ("Human: Test\nAssistant: Response", 5),  # First call (incremental)
-            ("Human: Test\nAssistant: Response", 5),  # Second call (full context)
-        ])
+        # Simulate having new messages (incremental read, then full context)
+        mock_read_conv = mock.MagicMock(return_value=("Human: Test\nAssistant: Response", 5, 640))
+        mock_get_conv = mock.MagicMock(return_value=("Human: Test\nAssistant: Response", 5))
+        monkeypatch.setattr(daemon.session_parser, 'read_conversation', mock_read_conv)
         monkeypatch.setattr(daemon.session_parser, 'get_conversation_text', mock_get_conv)
         monkeypatch.setattr(daemon.session_parser, 'parse_session_messages', mock.MagicMock(return_value=iter([])))
 
@@ -390,7 +456,8 @@ class TestProcessSession:
         monkeypatch.setattr(daemon, 'extract_insights', mock_extract)
 
         state = {"sessions": {"test": {"last_line": 0, "pending_messages": 0}}, "extractions_count": 0}
-        result = await daemon.process_session(session_file, state)
+        result = await daemon.process_session(self.SESSION_FILE, state)
 
         assert result is True
         mock_extract.assert_called_once()
+        assert state["sessions"]["test"]["last_offset"] == 640
@@ -0,0 +1,449 @@
+"""Tests for the synthetic document generator (tests/document_generator.py)."""
+import hashlib
+import importlib.util
+import json
+from unittest import mock
+
+import pytest
+
+from tests import document_generator
+
+
+def _without_faq_automaton():
+    """Serve the FAQ index with its automaton removed to force the regex path."""
+    index = document_generator._faq_index()._replace(automaton=None)
+    return mock.patch.object(document_generator, "_faq_index", return_value=index)
+
+
+class TestFindFaq:
+    """Tests for FAQ keyword lookup."""
+
+    def test_matches_keyword(self):
+        """find_faq should return the FAQ covering a keyword in the query."""
+        result = document_generator.find_faq("How do I get a REFUND?")
+
+        assert 0 in result
+        assert "refund" in document_generator.FAQ_TOPICS[0].keywords
+
+    def test_faqs_for_keyword(self):
+        """faqs_for_keyword should resolve a keyword via the inverted index."""
+        result = document_generator.faqs_for_keyword("Shipping")
+
+        assert result
+        for i in result:
+            assert "shipping" in document_generator.FAQ_KEYWORDS[i]
+        assert document_generator.faqs_for_keyword("no-such-keyword") == ()
+
+    def test_no_match(self):
+        """find_faq should return an empty list for unrelated queries."""
+        assert document_generator.find_faq("zzz qqq") == []
+
+    def test_regex_fallback_matches_automaton(self):
+        """The regex fallback should agree with the automaton when available."""
+        query = "Can I track my shipping and use a promo code?"
+        expected = document_generator.find_faq(query)
+
+        document_generator.resolve_faq.cache_clear()
+        with _without_faq_automaton():
+            assert document_generator.find_faq(query) == expected
+        document_generator.resolve_faq.cache_clear()
+
+    def test_regex_fallback_reports_prefix_keywords(self):
+        """A longer keyword match should also report FAQs keyed on its prefix."""
+        document_generator.resolve_faq.cache_clear()
+        with _without_faq_automaton():
+            result = document_generator.find_faq("open order history")
+        document_generator.resolve_faq.cache_clear()
+
+        assert 0 in result  # "order history"
+        assert 3 in result  # "order"
+
+    def test_equivalent_queries_share_cache_entry(self):
+        """Case and whitespace variants should resolve through one cache entry."""
+        document_generator.resolve_faq.cache_clear()
+
+        first = document_generator.find_faq("Track my   ORDER")
+        second = document_generator.find_faq("track my order")
+
+        assert first == second
+        assert document_generator.resolve_faq.cache_info().hits == 1
+
+    def test_soa_arrays_align_with_topics(self):
+        """The parallel FAQ arrays should mirror FAQ_TOPICS entry by entry."""
+        topics = document_generator.FAQ_TOPICS
+
+        assert len(document_generator.FAQ_QUESTIONS) == len(topics)
+        assert "paypal" in document_generator.FAQ_KEYWORDS[1]
+
+    def test_get_answer_slices_buffer(self):
+        """get_answer should return each FAQ's original answer text."""
+        topics = document_generator.FAQ_TOPICS
+
+        for i, faq in enumerate(topics):
+            assert document_generator.get_answer(i) == faq.answer
+
+    def test_resolve_faq_batch_matches_single_queries(self):
+        """Batch resolution should return the same hits as find_faq per query."""
+        queries = ["Where is my refund?", "zzz", "Apple Pay   accepted?"]
+
+        results = document_generator.resolve_faq_batch(queries)
+
+        assert results == [tuple(document_generator.find_faq(q)) for q in queries]
+
+
+class TestLazyLoading:
+    """Tests for deferred FAQ/policy construction (PEP 562 module __getattr__)."""
+
+    def _fresh_module(self):
+        spec = importlib.util.spec_from_file_location(
+            "document_generator_fresh", document_generator.__file__
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    def test_import_does_not_load_faqs(self):
+        """Importing the module should not build FAQ_TOPICS."""
+        module = self._fresh_module()
+
+        assert module._faq_index.cache_info().currsize == 0
+
+    def test_first_access_builds_faqs(self):
+        """Accessing FAQ_TOPICS should load it and its derived indexes once."""
+        module = self._fresh_module()
+
+        assert len(module.FAQ_TOPICS) == 25
+        assert module.FAQ_KEYWORDS is module._faq_index().keywords
+        assert module._faq_index.cache_info().currsize == 1
+        assert "FAQ_TOPICS" not in vars(module)
+
+    def test_import_does_not_build_policies(self):
+        """Importing the module should not build POLICY_TEMPLATES."""
+        module = self._fresh_module()
+
+        assert module._policy_index.cache_info().currsize == 0
+
+    def test_first_access_builds_policies(self):
+        """Accessing POLICY_TEMPLATES should build it and the policy indexes once."""
+        module = self._fresh_module()
+
+        assert len(module.POLICY_TEMPLATES) == len(module.POLICY_TITLES)
+        assert module._policy_index.cache_info().currsize == 1
+        assert "POLICY_TEMPLATES" not in vars(module)
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names should still raise AttributeError."""
+        module = self._fresh_module()
+
+        with pytest.raises(AttributeError):
+            _ = module.NOT_A_REAL_NAME
+
+
+class TestPolicies:
+    """Tests for policy templates backed by markdown files."""
+
+    def test_every_policy_has_a_body(self):
+        """Each policy slug should resolve to a markdown file with its title."""
+        for policy in document_generator.POLICY_TEMPLATES:
+            assert policy.content.startswith("# ")
+
+    def test_content_cache_is_bounded(self):
+        """Only POLICY_CACHE_SIZE bodies should stay cached."""
+        document_generator.get_policy_content.cache_clear()
+
+        for policy in document_generator.POLICY_TEMPLATES:
+            content = policy.content
+            assert content
+
+        info = document_generator.get_policy_content.cache_info()
+        assert info.maxsize == document_generator.POLICY_CACHE_SIZE
+        assert info.currsize == document_generator.POLICY_CACHE_SIZE
+
+    def test_soa_arrays_align_with_records(self):
+        """get_policy should join the parallel arrays at an index."""
+        policy = document_generator.get_policy(1)
+
+        assert policy.title == document_generator.POLICY_TITLES[1] == "Shipping Policy"
+        assert policy.keywords == frozenset(document_generator.POLICY_KEYWORDS[1])
+        assert "tracking" in policy.keywords
+        assert policy.content == document_generator.get_policy_content("shipping")
+
+    def test_http_rendering(self):
+        """get_policy_http should return encoded body, quoted ETag and length."""
+        body, etag, length = document_generator.get_policy_http("privacy")
+
+        assert body == document_generator.get_policy_content("privacy").encode("utf-8")
+        assert length == len(body)
+        assert etag.startswith('"') and etag.endswith('"')
+        assert document_generator.get_policy_http("privacy")[1] is etag
+        assert document_generator.get_policy_http("cookies")[1] != etag
+
+    def test_http_cache_is_bounded(self):
+        """Only POLICY_CACHE_SIZE encoded bodies should stay cached."""
+        document_generator.get_policy_http.cache_clear()
+
+        for slug in document_generator.POLICY_SLUGS:
+            document_generator.get_policy_http(slug)
+
+        info = document_generator.get_policy_http.cache_info()
+        assert info.maxsize == document_generator.POLICY_CACHE_SIZE
+        assert info.currsize == document_generator.POLICY_CACHE_SIZE
+
+    def test_policy_records_are_frozen_and_hashable(self):
+        """Policy records should be immutable and usable as cache keys."""
+        policy = document_generator.get_policy(0)
+
+        with pytest.raises(AttributeError):
+            policy.title = "changed"
+        assert {policy: 1}[document_generator.get_policy(0)] == 1
+        assert not hasattr(policy, "__dict__")
+
+    def test_snippets_are_rendered(self):
+        """Policy bodies should have shared boilerplate placeholders expanded."""
+        content = document_generator.get_policy_content("privacy")
+
+        assert "{" not in content
+        assert document_generator.SNIPPETS["support_phone"] in content
+        assert document_generator.SNIPPETS["company_address"] in content
+
+    def test_search_policies_keyword_first(self):
+        """The policy tagged with a keyword in the query should rank first."""
+        results = document_generator.search_policies("Is there an extended warranty?")
+
+        assert results[0].title == "Warranty Policy"
+
+    def test_search_policies_shared_keyword(self):
+        """A keyword shared by several policies should rank all of them first."""
+        titles = {p.title for p in document_generator.search_policies("privacy", limit=2)}
+
+        assert titles == {"Privacy Policy", "Cookie Policy"}
+
+    def test_search_policies_matches_phrases(self):
+        """Multi-word keyword phrases in the query should rank their policies first."""
+        query = "Do you offer a PRICE ADJUSTMENT or extended warranty?"
+        titles = {p.title for p in document_generator.search_policies(query, limit=2)}
+
+        assert titles == {"Warranty Policy", "Price Adjustment Policy"}
+
+    def test_search_policies_regex_fallback_matches_automaton(self):
+        """The regex fallback should agree with the automaton when available."""
+        query = "cookies, tracking and refund difference"
+        expected = document_generator.search_policies(query, limit=10)
+
+        index = document_generator._policy_index()._replace(automaton=None)
+        with mock.patch.object(document_generator, "_policy_index", return_value=index):
+            assert document_generator.search_policies(query, limit=10) == expected
+
+    def test_search_policies_ranks_by_bm25(self):
+        """search_policies should rank the most relevant body first."""
+        results = document_generator.search_policies("PCI encryption", limit=2)
+
+        assert results[0].title == "Payment Security Policy"
+        assert len(results) <= 2
+
+    def test_search_policies_unknown_terms(self):
+        """Queries with no indexed terms should return no policies."""
+        assert document_generator.search_policies("zzz qqq") == []
+
+    def test_keywords_are_interned(self):
+        """Keywords shared across policies should be the same object."""
+        keywords = document_generator.POLICY_KEYWORDS
+        privacy = [kw for kws in keywords for kw in kws if kw == "privacy"]
+
+        assert len(privacy) == 2
+        assert privacy[0] is privacy[1]
+
+
+class TestGenerateAllDocuments:
+    """Tests for full corpus generation."""
+
+    def test_generates_every_template(self, capsys):
+        """All templates should become Documents with unique IDs."""
+        docs = document_generator.generate_all_documents()
+
+        assert len(docs) == 45
+        assert len({doc.id for doc in docs}) == len(docs)
+
+    def test_records_content_digest(self, capsys):
+        """Each Document should carry its UTF-8 content and its SHA-256."""
+        docs = document_generator.generate_all_documents()
+
+        assert docs[0].content_utf8 == docs[0].content.encode("utf-8")
+        assert docs[0].content_sha256 == hashlib.sha256(docs[0].content_utf8).digest()
+
+    def test_skips_duplicate_content(self, capsys):
+        """Templates with identical content should only be emitted once."""
+        ticket = document_generator.SUPPORT_TICKET_TEMPLATES[0]
+
+        document_generator.generate_support_tickets.cache_clear()
+        with mock.patch.object(
+            document_generator, "SUPPORT_TICKET_TEMPLATES", (ticket, ticket._replace())
+        ):
+            docs = document_generator.generate_all_documents()
+        document_generator.generate_support_tickets.cache_clear()
+
+        assert sum(doc.category == "Support Ticket" for doc in docs) == 1
+        assert "Duplicates skipped: 1" in capsys.readouterr().out
+
+    def test_group_generators_are_cached(self):
+        """Per-group generators should return the same frozen tuple each call."""
+        first = document_generator.generate_faq_documents()
+
+        assert document_generator.generate_faq_documents() is first
+        with pytest.raises(AttributeError):
+            first[0].title = "changed"
+
+    def test_ids_follow_prefix_table(self):
+        """Document IDs should come from the zero-padded per-prefix table."""
+        docs = document_generator.generate_policy_documents()
+
+        assert [doc.id for doc in docs[:2]] == ["POL-001", "POL-002"]
+        assert document_generator._doc_ids("POL", len(docs))[-1] == docs[-1].id
+
+    def test_keywords_are_lowercase_frozensets(self):
+        """Document and query keywords should be directly intersectable."""
+        doc = document_generator.generate_faq_documents()[1]
+        query = document_generator.get_test_queries()[1]
+
+        assert isinstance(doc.keywords, frozenset)
+        assert "paypal" in doc.keywords
+        assert query.expected_keywords & doc.keywords == {"payment", "credit card", "paypal"}
+
+    def test_build_keyword_index(self):
+        """The inverted index should map each keyword to the docs carrying it."""
+        docs = document_generator.generate_all_documents()
+
+        index = document_generator.build_keyword_index(docs)
+
+        assert index["refund"].typecode == "i"
+        assert all("refund" in docs[i].keywords for i in index["refund"])
+        assert len(index["refund"]) == sum("refund" in doc.keywords for doc in docs)
+
+    def test_iter_all_documents_covers_corpus(self, capsys):
+        """Iteration should yield the same documents, in order, as generate_all_documents."""
+        ids = [doc.id for doc in document_generator.iter_all_documents()]
+
+        assert ids == [doc.id for doc in document_generator.generate_all_documents()]
+
+    def test_generation_prints_single_summary(self, capsys):
+        """Group generation should report once, after all groups finish."""
+        document_generator.generate_all_documents()
+
+        out = capsys.readouterr().out
+        assert "Generating" not in out
+        assert out.count("Total documents generated: 45") == 1
+
+    def test_verbose_flag_silences_summary(self, capsys):
+        """With VERBOSE off, generation should write nothing to stdout."""
+        with mock.patch.object(document_generator, "VERBOSE", False):
+            docs = document_generator.generate_all_documents()
+
+        assert len(docs) == 45
+        assert capsys.readouterr().out == ""
+
+    def test_documents_by_category(self, capsys):
+        """Documents should share one Category member per type and group by it."""
+        docs = document_generator.generate_all_documents()
+
+        groups = document_generator.documents_by_category(docs)
+
+        Category = document_generator.Category
+        assert [len(groups[c]) for c in Category] == [25, 10, 5, 5]
+        assert all(doc.category is Category.POLICY for doc in groups[Category.POLICY])
+        assert docs[0].category == "FAQ" and str(docs[0].category) == "FAQ"
+
+    def test_digest_computed_on_construction(self):
+        """Documents built directly should still carry their content digest."""
+        doc = document_generator.Document(
+            id="X-1", category=document_generator.Category.FAQ,
+            title="t", content="café", keywords=frozenset(),
+        )
+
+        assert doc.content_utf8 == "café".encode("utf-8")
+        assert doc.content_sha256 == hashlib.sha256(doc.content_utf8).digest()
+        assert doc.content_normalized == "cafe"
+        assert not hasattr(doc, "__dict__")
+
+    def test_templates_are_immutable_records(self):
+        """Template tables should be tuples of named records, not dicts."""
+        guide = document_generator.PRODUCT_GUIDE_TEMPLATES[0]
+
+        assert isinstance(document_generator.SUPPORT_TICKET_TEMPLATES, tuple)
+        assert guide.title.startswith("Getting Started")
+        assert isinstance(guide.keywords, tuple)
+        assert isinstance(document_generator.FAQ_TOPICS[0], document_generator.FaqRec)
+
+    def test_test_queries_are_cached_records(self):
+        """get_test_queries should build its immutable records only once."""
+        queries = document_generator.get_test_queries()
+
+        assert document_generator.get_test_queries() is queries
+        assert len(queries) == 20
+        assert queries[5].category is document_generator.Category.POLICY
+        with pytest.raises(AttributeError):
+            queries[0].query = "changed"
+
+    def test_bulk_payloads_are_bounded_ndjson(self):
+        """Bulk payloads should pair action and source lines within max_bytes."""
+        payloads = list(document_generator.iter_bulk_payloads(max_bytes=20_000))
+
+        lines = [line for p in payloads for line in p.splitlines()]
+        assert len(lines) == 2 * 45
+        assert json.loads(lines[0]) == {"index": {"_id": "FAQ-001"}}
+        assert json.loads(lines[1])["category"] == "FAQ"
+        assert len(payloads) > 1
+        assert all(len(p) <= 20_000 for p in payloads)
+
+    def test_bulk_payloads_json_fallback(self):
+        """The stdlib encoder should produce the same payloads as the C encoders."""
+        expected = list(document_generator.iter_bulk_payloads())
+
+        with mock.patch.object(document_generator, "_MSGSPEC_ENCODER", None), \
+                mock.patch.object(document_generator, "orjson", None):
+            assert list(document_generator.iter_bulk_payloads()) == expected
+
+    def test_search_documents_ranks_corpus(self):
+        """search_documents should rank across every document type."""
+        results = document_generator.search_documents("robot vacuum error codes", limit=3)
+
+        assert results[0].title.startswith("Robot Vacuum")
+        assert len(results) == 3
+        assert document_generator.search_documents("zzz qqq") == []
+
+    def test_term_freqs_numpy_matches_fallback(self):
+        """The numpy histogram path should count exactly like the dict fallback."""
+        docs = [["a", "b", "a"], [], ["c", "a"]]
+
+        expected = {"a": {0: 2, 2: 1}, "b": {0: 1}, "c": {2: 1}}
+        assert document_generator._term_freqs(docs) == expected
+        with mock.patch.object(document_generator, "np", None):
+            assert document_generator._term_freqs(docs) == expected
+
+    def test_content_blob_views(self):
+        """Blob views should reproduce each document's encoded content."""
+        corpus = document_generator._corpus()
+
+        for i, doc in enumerate(corpus):
+            assert document_generator.get_content_view(i) == doc.content_utf8
+
+    def test_documents_containing_scans_blob(self):
+        """Blob scans should agree with per-document substring checks."""
+        corpus = document_generator._corpus()
+
+        for text in ("warranty", "PMATCH-45934", "café", "zzz qqq"):
+            expected = [doc for doc in corpus if text in doc.content]
+            assert document_generator.documents_containing(text) == expected
+
+    def test_documents_compare_by_content_digest(self):
+        """Documents with identical content should collapse in a set."""
+        Document = document_generator.Document
+        a = Document(id="A", category=document_generator.Category.FAQ,
+                     title="a", content="same", keywords=frozenset())
+        b = Document(id="B", category=document_generator.Category.POLICY,
+                     title="b", content="same", keywords=frozenset({"x"}))
+        c = Document(id="C", category=document_generator.Category.FAQ,
+                     title="a", content="other", keywords=frozenset())
+
+        assert a == b and hash(a) == hash(b)
+        assert a != c
+        assert len({a, b, c}) == 2
@@ -121,6 +121,16 @@ class TestFindProjectRoot:
         result = find_project_root()
         assert result == temp_project
 
+    def test_picks_up_new_marker(self, temp_project):
+        """A marker created after an earlier lookup wins on the next one."""
+        subdir = temp_project / "src"
+        subdir.mkdir()
+        (temp_project / ".git").mkdir()
+        assert find_project_root(str(subdir)) == temp_project
+
+        (subdir / FLOW_GUARDIAN_DIR).mkdir()
+        assert find_project_root(str(subdir)) == subdir
+
 
 # ============ get_handoff_path TESTS ============
 
@@ -183,6 +193,29 @@ class TestLoadHandoff:
         result = load_handoff(project_with_flow_guardian)
         assert result is None
 
+    def test_reuses_parsed_data_until_file_changes(self, project_with_flow_guardian, valid_handoff_data, monkeypatch):
+        """Parses the file once while its mtime and size are unchanged."""
+        save_handoff(valid_handoff_data, project_with_flow_guardian)
+        calls = []
+        real_load = yaml.load
+        monkeypatch.setattr(yaml, "load", lambda f, Loader: calls.append(1) or real_load(f, Loader=Loader))
+
+        load_handoff(project_with_flow_guardian)
+        load_handoff(project_with_flow_guardian)
+        assert len(calls) == 1
+
+        update_handoff({"now": "Writing tests"}, project_with_flow_guardian)
+        assert load_handoff(project_with_flow_guardian)["now"] == "Writing tests"
+
+    def test_cached_result_is_not_shared(self, project_with_flow_guardian, valid_handoff_data):
+        """Mutating a loaded handoff does not leak into later loads."""
+        save_handoff(valid_handoff_data, project_with_flow_guardian)
+
+        first = load_handoff(project_with_flow_guardian)
+        first["files"].append("extra.py")
+
+        assert load_handoff(project_with_flow_guardian)["files"] == valid_handoff_data["files"]
+
 
 # ============ save_handoff TESTS ============
 
@@ -226,6 +226,60 @@ class TestGetConversationText:
         assert last_line == 0
 
 
+class TestReadConversation:
+    """Tests for read_conversation function."""
+
+    def test_resumes_from_byte_offset(self, tmp_path):
+        """Seeking to a returned offset should match reading by line number."""
+        session_file = tmp_path / "test.jsonl"
+        lines = [
+            json.dumps({"type": "user", "message": {"role": "user", "content": f"Message {i} é"}})
+            for i in range(4)
+        ]
+        session_file.write_text("\n".join(lines[:2]) + "\n")
+
+        text, last_line, last_offset = session_parser.read_conversation(session_file)
+        assert last_line == 1
+        assert last_offset == len(lines[0].encode()) + 1
+
+        with open(session_file, "a") as f:
+            f.write("\n".join(lines[2:]) + "\n")
+
+        resumed = session_parser.read_conversation(session_file, last_line, last_offset)
+        scanned = session_parser.read_conversation(session_file, last_line)
+        assert resumed == scanned
+        assert "Message 0" not in resumed[0]
+        assert resumed[1] == 3
+
+    def test_ignores_offset_past_end_of_file(self, tmp_path):
+        """A stale offset from a rewritten file falls back to line counting."""
+        session_file = tmp_path / "test.jsonl"
+        session_file.write_text(json.dumps({"type": "user", "message": {"role": "user", "content": "Only"}}))
+
+        text, last_line, _ = session_parser.read_conversation(session_file, 0, start_offset=10_000)
+        assert "Only" in text
+        assert last_line == 0
+
+    def test_ignores_offset_inside_a_line(self, tmp_path):
+        """An offset that no longer lands on a line boundary falls back to line counting."""
+        session_file = tmp_path / "test.jsonl"
+        short = [json.dumps({"type": "user", "message": {"role": "user", "content": f"Old {i}"}}) for i in range(2)]
+        session_file.write_text("\n".join(short) + "\n")
+        _, last_line, last_offset = session_parser.read_conversation(session_file)
+
+        # Rewritten with longer records: the old offset now points mid-line
+        long = [
+            json.dumps({"type": "user", "message": {"role": "user", "content": f"New message {i} " * 5}})
+            for i in range(3)
+        ]
+        session_file.write_text("\n".join(long) + "\n")
+        assert session_file.read_bytes()[last_offset - 1:last_offset] != b"\n"
+
+        resumed = session_parser.read_conversation(session_file, last_line, last_offset)
+        assert resumed == session_parser.read_conversation(session_file, last_line)
+        assert "New message 1" in resumed[0]
+
+
 class TestFindAllSessions:
     """Tests for find_all_sessions function."""
 
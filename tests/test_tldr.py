@@ -20,9 +20,14 @@ from tldr import (
     THRESHOLD_NO_TLDR,
     THRESHOLD_L1,
     THRESHOLD_L2,
+    MAX_TOKENS_L1,
 )
 from cerebras_client import CerebrasError
 
+# Sized for auto_summarize level selection; built once at import
+MEDIUM_CONTENT = "word " * 600  # ~3000 chars = ~750 tokens (L1)
+LARGE_CONTENT = "word " * 5000  # ~25000 chars = ~6250 tokens (L2)
+
 
 # ============ estimate_tokens TESTS ============
 
@@ -133,9 +138,9 @@ class TestSummarizeContext:
             mock_complete.side_effect = CerebrasError("API unavailable")
             result = summarize_context(large_content, "L1")
 
-            # Should return truncated content
-            assert len(result) <= len(large_content)
-            assert "truncated" in result or result.startswith("x")
+            # Should truncate to the L1 output budget (~4 chars per token)
+            assert len(result) <= MAX_TOKENS_L1 * 4
+            assert result.endswith("...[truncated]...")
 
 
 # ============ summarize_handoff TESTS ============
@@ -319,10 +324,7 @@ class TestAutoSummarize:
     def test_medium_content_uses_l1(self, mock_complete):
         """Medium content uses L1 summarization."""
         mock_complete.return_value = "L1 summary"
-        # Create medium content (500-2000 tokens = 2000-8000 chars)
-        medium = "word " * 600  # ~3000 chars = ~750 tokens
-
-        result = auto_summarize(medium)
+        result = auto_summarize(MEDIUM_CONTENT)
 
         mock_complete.assert_called_once()
         assert result == "L1 summary"
@@ -331,10 +333,7 @@ class TestAutoSummarize:
     def test_large_content_uses_l2(self, mock_complete):
         """Large content uses L2 summarization."""
         mock_complete.return_value = "L2 summary"
-        # Create large content (> 5000 tokens = > 20000 chars)
-        large = "word " * 5000  # ~25000 chars = ~6250 tokens
-
-        result = auto_summarize(large)
+        result = auto_summarize(LARGE_CONTENT)
 
         mock_complete.assert_called_once()
         # Check that L2 prompt characteristics were used
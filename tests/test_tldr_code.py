@@ -6,6 +6,7 @@ from tldr_code import (
     generate_code_tldr,
     measure_quality,
     _format_function_signature,
+    _format_sig_no_types,
     _get_annotation,
     _extract_function_calls,
 )
@@ -230,6 +231,15 @@ class TestFormatFunctionSignature:
         sig = _format_function_signature(func)
         assert "async" in sig
 
+    def test_no_types_fast_path_matches(self):
+        import ast
+        code = "async def foo(a: int, *args: str, **kw: bool) -> None: pass"
+        tree = ast.parse(code)
+        func = tree.body[0]
+        sig = _format_sig_no_types(func)
+        assert sig == "async foo(a, *args, **kw)"
+        assert sig == _format_function_signature(func, include_types=False)
+
 
 class TestExtractFunctionCalls:
     """Tests for call graph extraction."""
@@ -148,6 +148,7 @@ class TestShouldBypass:
         assert "Small file" in reason
 
 
+@pytest.mark.slow
 class TestHookExecution:
     """Test hook execution via subprocess."""
 
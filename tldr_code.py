@@ -92,7 +92,10 @@ def extract_python_structure(content: str, filename: str = "file.py", level: str
             if methods:
                 method_sigs = []
                 for method in methods[:10]:  # Limit to 10 methods
-                    sig = _format_function_signature(method, include_types=level != "L1")
+                    if level == "L1":
+                        sig = _format_sig_no_types(method)
+                    else:
+                        sig = _format_function_signature(method, include_types=True)
                     method_sigs.append(sig)
                 lines.append(f"  Methods: {', '.join(method_sigs)}")
                 if len(methods) > 10:
@@ -162,6 +165,18 @@ def _format_function_signature(node: ast.FunctionDef, include_types: bool = True
     return f"{prefix}{name}({', '.join(args)}){return_str}"
 
 
+def _format_sig_no_types(node: ast.FunctionDef) -> str:
+    """Format a function signature without annotations (L1 fast path)."""
+    a = node.args
+    params = [arg.arg for arg in a.args]
+    if a.vararg:
+        params.append(f"*{a.vararg.arg}")
+    if a.kwarg:
+        params.append(f"**{a.kwarg.arg}")
+    prefix = "async " if isinstance(node, ast.AsyncFunctionDef) else ""
+    return f"{prefix}{node.name}({', '.join(params)})"
+
+
 def _get_annotation(node) -> str:
     """Get string representation of a type annotation."""
     if isinstance(node, ast.Name):